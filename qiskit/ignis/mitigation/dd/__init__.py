@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Dynamical decoupling error mitigation.
+
+This sub-module provides transpiler passes that schedule a circuit and
+insert dynamical decoupling sequences in its idle periods.
+"""
+
+from .barriers_to_delays import (BarriersToDelaysAndMergePass,
+                                 BarriersToDelaysPass)
+from .dd_pass_manager import gate_lengths_table, get_dd_pass_manager
+from .delay_to_dd_sequence import DelayToDynamicalDecouplingSequencePass
+from .flag_fundamental_state_operations import FlagFundamentalStateOperations
+from .merge_delays import MergeDelaysPass
+from .sequences import (BaseDynamicalDecouplingSequence,
+                        CarrPurcellDynamicalDecouplingSequence,
+                        CPMGGateDynamicalDecouplingSequence,
+                        CPMGPulseDynamicalDecouplingSequence,
+                        HahnSpinEchoDynamicalDecouplingSequence,
+                        HahnSpinEchoPreRotatedDynamicalDecouplingSequence,
+                        HahnSpinEchoPulseDynamicalDecouplingSequence,
+                        UhrigGateDynamicalDecouplingSequence,
+                        UhrigPulseDynamicalDecouplingSequence,
+                        XY4DynamicalDecouplingSequence,
+                        XY4KDDDynamicalDecouplingSequence,
+                        XY4PulseDynamicalDecouplingSequence)
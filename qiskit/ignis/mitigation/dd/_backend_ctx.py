@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Cached access to the static data of a backend.
+"""
+
+from typing import Dict, List
+from weakref import WeakKeyDictionary, ref
+
+from qiskit.pulse import DriveChannel
+
+
+class BackendCtx:
+    """Lazily-fetched, memoised views of the static data of a backend.
+
+    ``backend.configuration()``, ``backend.properties()`` and
+    ``backend.defaults()`` can be expensive (remote calls on IBMQ
+    backends) and were re-fetched by every sequence construction. The
+    context fetches each of them at most once, on first access.
+    """
+
+    def __init__(self, backend):
+        """Initialise the context.
+
+        Args:
+            backend: the wrapped backend.
+        """
+        # The backend is held weakly: contexts are cached per backend
+        # and a strong reference here would keep collected backends
+        # alive through the cache.
+        self._backend_ref = ref(backend)
+        self._configuration = None
+        self._properties = None
+        self._defaults = None
+        self._drive_channels = None
+        self._default_x_calibrations = None
+
+    @property
+    def backend(self):
+        """The wrapped backend."""
+        return self._backend_ref()
+
+    @property
+    def configuration(self):
+        """Configuration of the backend, fetched on first access."""
+        if self._configuration is None:
+            self._configuration = self.backend.configuration()
+        return self._configuration
+
+    @property
+    def properties(self):
+        """Properties of the backend, fetched on first access."""
+        if self._properties is None:
+            self._properties = self.backend.properties()
+        return self._properties
+
+    @property
+    def defaults(self):
+        """Pulse defaults of the backend, fetched on first access."""
+        if self._defaults is None:
+            self._defaults = self.backend.defaults()
+        return self._defaults
+
+    @property
+    def instruction_schedule_map(self):
+        """Default instruction schedule map of the backend."""
+        return self.defaults.instruction_schedule_map
+
+    @property
+    def num_qubits(self) -> int:
+        """Number of qubits of the backend."""
+        return self.configuration.num_qubits
+
+    @property
+    def dt(self) -> float:
+        """Duration of a backend sample in seconds."""
+        return self.configuration.dt
+
+    @property
+    def drive_channels(self) -> List[DriveChannel]:
+        """Drive channels of the backend, one per qubit.
+
+        Built once on first access: DriveChannel construction runs
+        validation every time and the calibration builders otherwise
+        re-created the same channels on every scan of the qubits.
+        """
+        if self._drive_channels is None:
+            self._drive_channels = [DriveChannel(qubit_index)
+                                    for qubit_index in range(self.num_qubits)]
+        return self._drive_channels
+
+    @property
+    def default_x_calibrations(self) -> Dict[int, object]:
+        """Default X-pulse calibration of each qubit.
+
+        Built once on first access: InstructionScheduleMap.get copies
+        the schedule on every call, so the per-qubit lookups are done
+        a single time per backend instead of once per calibration
+        builder.
+        """
+        if self._default_x_calibrations is None:
+            instruction_schedule_map = self.instruction_schedule_map
+            self._default_x_calibrations = {
+                qubit_index: instruction_schedule_map.get("x", [qubit_index])
+                for qubit_index in range(self.num_qubits)}
+        return self._default_x_calibrations
+
+
+# Contexts are cached weakly so that long-running processes touching
+# many backends do not accumulate them: once a backend is garbage
+# collected, its context (and the configuration, properties and
+# defaults it memoised) goes with it.
+_backend_ctx_cache: "WeakKeyDictionary[object, BackendCtx]" = \
+    WeakKeyDictionary()
+
+
+def backend_ctx(backend) -> BackendCtx:
+    """Return the shared :class:`BackendCtx` of the given backend.
+
+    Args:
+        backend: the backend to wrap.
+
+    Returns:
+        BackendCtx: the context, shared by every caller asking for the
+        same backend.
+    """
+    ctx = _backend_ctx_cache.get(backend)
+    if ctx is None:
+        ctx = _backend_ctx_cache[backend] = BackendCtx(backend)
+    return ctx
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Numerical scheduling kernel for the dynamical decoupling passes.
+"""
+
+import numpy as np
+
+from qiskit.ignis.numba import jit_fallback
+
+
+@jit_fallback
+def schedule_delays(qubit_ids, qubit_offsets, durations_dt, num_qubits):
+    """Compute the alignment delays of an as-soon-as-possible schedule.
+
+    The circuit is described in flattened form: the qubit indices of
+    operation ``i`` are ``qubit_ids[qubit_offsets[i]:qubit_offsets[i + 1]]``
+    and its duration in ``dt`` is ``durations_dt[i]`` (zero for
+    barriers). The kernel scans the operations in order, keeping a
+    per-qubit clock, and records every delay that must be inserted to
+    align the involved qubits before an operation starts. It is pure
+    integer array arithmetic so that numba, when available, compiles
+    it to native code; without numba it runs as regular Python.
+
+    Args:
+        qubit_ids: int64 array, concatenated qubit indices of all the
+            operations.
+        qubit_offsets: int64 array of length ``num_ops + 1``, offsets
+            of each operation into ``qubit_ids``.
+        durations_dt: int64 array, duration of each operation in
+            ``dt``.
+        num_qubits: number of qubits of the circuit.
+
+    Returns:
+        tuple: arrays ``(event_op, event_qubit, event_dt)`` and the
+        number of valid events. Event ``j`` inserts a delay of
+        ``event_dt[j]`` dt on qubit ``event_qubit[j]`` immediately
+        before operation ``event_op[j]``; events with
+        ``event_op[j] == num_ops`` are the trailing delays padding
+        every qubit to the total circuit duration.
+    """
+    num_ops = qubit_offsets.shape[0] - 1
+    times_dt = np.zeros(num_qubits, dtype=np.int64)
+    # Each operation inserts at most one delay per involved qubit and
+    # the trailing padding at most one delay per qubit.
+    max_events = qubit_ids.shape[0] + num_qubits
+    event_op = np.empty(max_events, dtype=np.int64)
+    event_qubit = np.empty(max_events, dtype=np.int64)
+    event_dt = np.empty(max_events, dtype=np.int64)
+    num_events = 0
+
+    for op_index in range(num_ops):
+        start = qubit_offsets[op_index]
+        end = qubit_offsets[op_index + 1]
+        start_time_dt = 0
+        for i in range(start, end):
+            qubit_time_dt = times_dt[qubit_ids[i]]
+            if qubit_time_dt > start_time_dt:
+                start_time_dt = qubit_time_dt
+        for i in range(start, end):
+            qubit_index = qubit_ids[i]
+            delay_dt = start_time_dt - times_dt[qubit_index]
+            if delay_dt > 0:
+                event_op[num_events] = op_index
+                event_qubit[num_events] = qubit_index
+                event_dt[num_events] = delay_dt
+                num_events += 1
+        end_time_dt = start_time_dt + durations_dt[op_index]
+        for i in range(start, end):
+            times_dt[qubit_ids[i]] = end_time_dt
+
+    max_time_dt = 0
+    for qubit_index in range(num_qubits):
+        if times_dt[qubit_index] > max_time_dt:
+            max_time_dt = times_dt[qubit_index]
+    for qubit_index in range(num_qubits):
+        delay_dt = max_time_dt - times_dt[qubit_index]
+        if delay_dt > 0:
+            event_op[num_events] = num_ops
+            event_qubit[num_events] = qubit_index
+            event_dt[num_events] = delay_dt
+            num_events += 1
+
+    return event_op, event_qubit, event_dt, num_events
+
+
+@jit_fallback
+def udd_scales(repetition_number):
+    """Relative scales of the idle intervals of an Uhrig sequence.
+
+    The inter-pulse scales are the differences of the sin^2 Uhrig
+    offsets, computed through the product-to-sum identity
+    ``sin^2(a) - sin^2(b) = sin(a + b) * sin(a - b)`` so that each
+    scale is a constant times a single sine, without the cancellation
+    error of differencing near-equal sin^2 values at the ends of the
+    sequence. Numba, when available, compiles the vectorised sine to
+    native code.
+
+    Args:
+        repetition_number: number of idle intervals of the sequence.
+
+    Returns:
+        np.ndarray: float64 array of the relative scale of each idle
+        interval, summing to one.
+    """
+    half_step = np.pi / (2 * repetition_number)
+    indices = np.arange(repetition_number)
+    return np.sin(half_step) * np.sin((2 * indices + 1) * half_step)
+
+
+@jit_fallback
+def partition_durations(idle_fractions, idle_duration_dt):
+    """Partition an idle duration between scalable components.
+
+    Implements the cumulative prefix-sum rounding used by the
+    dynamical decoupling sequences: component ``i`` receives the
+    difference between the rounded cumulative target
+    ``round(idle_duration_dt * sum(idle_fractions[:i + 1]))`` and the
+    total assigned so far, so the returned durations always sum to
+    ``idle_duration_dt`` exactly.
+
+    Args:
+        idle_fractions: float64 array, share of the idle time of each
+            scalable component (summing to one).
+        idle_duration_dt: the idle duration to partition, in ``dt``.
+
+    Returns:
+        np.ndarray: int64 array of the per-component durations in
+        ``dt``.
+    """
+    num_components = idle_fractions.shape[0]
+    durations_dt = np.empty(num_components, dtype=np.int64)
+    cumulative_fraction = 0.0
+    assigned_dt = 0
+    for index in range(num_components):
+        cumulative_fraction += idle_fractions[index]
+        target_dt = int(round(idle_duration_dt * cumulative_fraction))
+        durations_dt[index] = target_dt - assigned_dt
+        assigned_dt = target_dt
+    return durations_dt
+
+
+@jit_fallback
+def partition_durations_int(scales, idle_duration_dt, total_scale):
+    """Integer-arithmetic variant of :func:`partition_durations`.
+
+    Used when every relative scale of the sequence is an integer
+    (which is the case for all the Carr-Purcell-style templates): the
+    cumulative targets are computed with a half-up integer division,
+    which avoids the float conversions and the tie behaviour of
+    ``round`` while keeping the exactness guarantee, since the last
+    cumulative scale equals ``total_scale``.
+
+    Args:
+        scales: int64 array, relative scale of each scalable
+            component.
+        idle_duration_dt: the idle duration to partition, in ``dt``.
+        total_scale: sum of ``scales``.
+
+    Returns:
+        np.ndarray: int64 array of the per-component durations in
+        ``dt``.
+    """
+    num_components = scales.shape[0]
+    durations_dt = np.empty(num_components, dtype=np.int64)
+    half_total_scale = total_scale // 2
+    cumulative_scale = 0
+    assigned_dt = 0
+    for index in range(num_components):
+        cumulative_scale += scales[index]
+        target_dt = (idle_duration_dt * cumulative_scale +
+                     half_total_scale) // total_scale
+        durations_dt[index] = target_dt - assigned_dt
+        assigned_dt = target_dt
+    return durations_dt
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Utility functions for the dynamical decoupling sub-module.
+"""
+
+from typing import Dict, List, Tuple
+
+from qiskit import QuantumCircuit
+from qiskit.circuit.equivalence_library import SessionEquivalenceLibrary
+from qiskit.converters import circuit_to_dag, dag_to_circuit
+from qiskit.exceptions import QiskitError
+from qiskit.providers.models import BackendProperties
+from qiskit.transpiler.passes import BasisTranslator
+
+_DURATIONLESS_NODE_NAMES = frozenset(("barrier",))
+
+# Cache of the qubit-index tuples of DAG nodes, keyed by id(node).
+# The same physical qubits appear in thousands of nodes on large
+# circuits and rebuilding the same small tuple per node and per pass
+# is a measurable cost. Passes iterating a new DAG should call
+# clear_qarg_indices_cache() first, since node ids are only unique
+# among live objects.
+_qarg_indices_cache: Dict[int, Tuple[int, ...]] = {}
+
+
+def clear_qarg_indices_cache():
+    """Empty the per-node qubit-index cache."""
+    _qarg_indices_cache.clear()
+
+
+def qarg_indices(node) -> Tuple[int, ...]:
+    """Return the indices of the qubits the given DAG node acts on.
+
+    Args:
+        node: a DAG op node.
+
+    Returns:
+        tuple: the qubit indices of the node, cached by node identity.
+    """
+    key = id(node)
+    indices = _qarg_indices_cache.get(key)
+    if indices is None:
+        indices = tuple(qubit.index for qubit in node.qargs)
+        _qarg_indices_cache[key] = indices
+    return indices
+
+
+_units_conversion_to_seconds = {
+    "s": 1.0,
+    "ms": 1e-3,
+    "us": 1e-6,
+    "µs": 1e-6,
+    "ns": 1e-9,
+    "ps": 1e-12,
+}
+
+
+def to_seconds(time: float, unit: str) -> float:
+    """Convert the given time to seconds.
+
+    Args:
+        time: the time to convert.
+        unit: the unit ``time`` is expressed in.
+
+    Returns:
+        float: the given time in seconds.
+
+    Raises:
+        QiskitError: if ``unit`` is not a known time unit.
+    """
+    # Fast path: the scheduling passes call this once per node with
+    # unit="s", so the common case is answered with a single string
+    # comparison instead of a dict hash and lookup.
+    if unit == "s":
+        return time
+    if unit not in _units_conversion_to_seconds:
+        raise QiskitError("Unknown time unit '{}'.".format(unit))
+    return time * _units_conversion_to_seconds[unit]
+
+
+def to_dt_float(time: float, unit: str, dt: float) -> float:
+    """Convert the given time to a (possibly non-integer) number of ``dt``.
+
+    Args:
+        time: the time to convert.
+        unit: the unit ``time`` is expressed in. Can be ``"dt"``.
+        dt: duration of a backend sample in seconds.
+
+    Returns:
+        float: the given time as a floating-point multiple of ``dt``.
+
+    Raises:
+        QiskitError: if ``unit`` is not a known time unit.
+    """
+    if unit == "dt":
+        return time
+    if unit == "s":
+        return time / dt
+    return to_seconds(time, unit) / dt
+
+
+def to_dt_rounded(time: float, unit: str, dt: float) -> int:
+    """Convert the given time to the closest integer number of ``dt``.
+
+    Args:
+        time: the time to convert.
+        unit: the unit ``time`` is expressed in. Can be ``"dt"``.
+        dt: duration of a backend sample in seconds.
+
+    Returns:
+        int: the given time rounded to an integer multiple of ``dt``.
+
+    Raises:
+        QiskitError: if ``unit`` is not a known time unit.
+    """
+    return int(round(to_dt_float(time, unit, dt)))
+
+
+def to_dt_assert_exact(time: float, unit: str, dt: float,
+                       absolute_error: float = 1e-2) -> int:
+    """Convert the given time to an integer number of ``dt``.
+
+    Contrarily to :func:`to_dt_rounded`, this function checks that the
+    given time really is an integer multiple of ``dt`` (up to
+    ``absolute_error``) and raises if it is not.
+
+    Args:
+        time: the time to convert.
+        unit: the unit ``time`` is expressed in. Can be ``"dt"``.
+        dt: duration of a backend sample in seconds.
+        absolute_error: maximum accepted deviation, in fractions of
+            ``dt``, between the given time and an integer multiple
+            of ``dt``.
+
+    Returns:
+        int: the given time as an integer multiple of ``dt``.
+
+    Raises:
+        QiskitError: if ``unit`` is not a known time unit or if the
+            given time deviates from an integer multiple of ``dt`` by
+            more than ``absolute_error``.
+    """
+    dt_float = to_dt_float(time, unit, dt)
+    # Round once and compare against the rounded value: this is both
+    # cheaper than truncating twice in the hot path and correct for
+    # values slightly below an integer, which truncation would reject.
+    dt_rounded = round(dt_float)
+    if abs(dt_float - dt_rounded) > absolute_error:
+        raise QiskitError(
+            "The given time ({} {}) is not an integer multiple of "
+            "dt = {} s.".format(time, unit, dt))
+    return dt_rounded
+
+
+# Translating a named gate to a given basis only depends on the gate
+# name and on the basis, so the result is shared across all the
+# components that need the same translation.
+_translation_cache: Dict[Tuple[str, Tuple[str, ...]], QuantumCircuit] = {}
+
+
+def clear_translation_cache():
+    """Empty the gate translation cache.
+
+    Mostly useful for tests that change the session equivalence
+    library between two translations.
+    """
+    _translation_cache.clear()
+
+
+def translate_circuit_to_basis(input_circuit: QuantumCircuit,
+                               basis_gates: List[str]) -> QuantumCircuit:
+    """Unroll the given circuit to the given basis.
+
+    Args:
+        input_circuit: the circuit to unroll.
+        basis_gates: the target basis.
+
+    Returns:
+        QuantumCircuit: the unrolled circuit.
+    """
+    dag = circuit_to_dag(input_circuit)
+    translated_dag = BasisTranslator(SessionEquivalenceLibrary,
+                                     basis_gates).run(dag)
+    return dag_to_circuit(translated_dag)
+
+
+def get_circuit_duration(input_circuit: QuantumCircuit,
+                         properties: BackendProperties,
+                         qargs: Tuple[int, ...]) -> Tuple[float, str]:
+    """Compute the duration of the given circuit on the given qubits.
+
+    The circuit is scheduled as-soon-as-possible with the gate
+    durations reported by the backend, the duration of the circuit
+    being the end time of its last operation.
+
+    Args:
+        input_circuit: the circuit whose duration is computed.
+        properties: properties of the backend the circuit would be
+            executed on.
+        qargs: the physical qubit indices the circuit wires map to.
+
+    Returns:
+        tuple: the duration of the circuit and its unit (``"s"``).
+    """
+    # A one-qubit circuit is a straight line of operations: its
+    # duration is the sum of its gate durations, no DAG construction
+    # or topological sort needed. This is the typical shape of an
+    # unrolled dynamical decoupling gate.
+    if input_circuit.num_qubits == 1:
+        qubit = [qargs[0]]
+        gate_length = properties.gate_length
+        return sum(gate_length(instruction.name, qubit)
+                   for instruction, _, _ in input_circuit.data
+                   if instruction.name not in _DURATIONLESS_NODE_NAMES), "s"
+    dag = circuit_to_dag(input_circuit)
+    durations = [0.0] * input_circuit.num_qubits
+    for node in dag.topological_op_nodes():
+        involved_qubits_indices = [qubit.index for qubit in node.qargs]
+        start_time = max(durations[i] for i in involved_qubits_indices)
+        if node.name in _DURATIONLESS_NODE_NAMES:
+            end_time = start_time
+        else:
+            end_time = start_time + properties.gate_length(
+                node.name, [qargs[i] for i in involved_qubits_indices])
+        for qubit_index in involved_qubits_indices:
+            durations[qubit_index] = end_time
+    return max(durations), "s"
@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Transpiler pass replacing barriers with explicit per-qubit delays.
+"""
+
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Delay
+from qiskit.converters import circuit_to_dag
+from qiskit.dagcircuit import DAGCircuit
+from qiskit.exceptions import QiskitError
+from qiskit.providers.models import BackendProperties
+from qiskit.transpiler.basepasses import TransformationPass
+
+from ._scheduling_kernel import schedule_delays
+from ._utils import (clear_qarg_indices_cache, qarg_indices,
+                     to_dt_assert_exact, to_dt_rounded)
+
+
+class BarriersToDelaysPass(TransformationPass):
+    """Schedule the circuit and replace barriers with explicit delays.
+
+    The pass performs a simple as-soon-as-possible (or as-late-as-possible)
+    scheduling of the circuit, using the gate durations reported by the
+    backend, and materialises every idle period as a
+    :class:`~qiskit.circuit.Delay` instruction expressed in ``dt``.
+    Barriers are removed in the process: the synchronisation they imply
+    is realised by the inserted delays.
+    """
+
+    def __init__(self, properties: BackendProperties, dt: float,
+                 scheduling_method: str = "asap",
+                 gate_lengths_dt: Optional[
+                     Dict[Tuple[str, Tuple[int, ...]], int]] = None):
+        """Initialise the pass.
+
+        Args:
+            properties: properties of the backend the circuit will be
+                executed on, used to recover gate durations.
+            dt: duration of a backend sample in seconds.
+            scheduling_method: either ``"asap"`` or ``"alap"``.
+            gate_lengths_dt: optional precomputed mapping from
+                ``(gate name, qubits)`` to the gate duration in
+                ``dt``, shared across the passes of a pipeline. Gates
+                missing from the mapping are recovered from the
+                backend properties (and added to the mapping).
+
+        Raises:
+            QiskitError: if ``scheduling_method`` is not a valid
+                scheduling method.
+        """
+        super().__init__()
+        if scheduling_method not in ("asap", "alap"):
+            raise QiskitError(
+                "Unknown scheduling method '{}'. Expected 'asap' or "
+                "'alap'.".format(scheduling_method))
+        self._properties = properties
+        self._dt = dt
+        self._scheduling_method = scheduling_method
+        self._gate_lengths_dt = gate_lengths_dt
+
+    def _make_duration_dt(self) -> Callable[[str, Tuple[int, ...]], int]:
+        """Build the memoised duration lookup shared by the passes.
+
+        The same (gate name, qubits) pair typically appears a large
+        number of times in a circuit, so the duration lookups are
+        memoised. When a precomputed table was given at construction
+        it seeds (and is shared with) the memo, making most lookups a
+        single dict hit. The backend accessors are captured as closure
+        locals, the returned callable being invoked once per
+        operation.
+
+        Returns:
+            Callable: a callable mapping ``(name, qubit_indices)`` to
+            the duration of the operation in ``dt``.
+        """
+        gate_length = self._properties.gate_length
+        readout_length = self._properties.readout_length
+        dt = self._dt
+        duration_dt_cache: Dict[Tuple[str, Tuple[int, ...]], int] = \
+            self._gate_lengths_dt if self._gate_lengths_dt is not None else {}
+
+        def _duration_dt(name: str, qubit_indices: Tuple[int, ...]) -> int:
+            key = (name, qubit_indices)
+            duration = duration_dt_cache.get(key)
+            if duration is None:
+                # Measurements do not appear in properties.gates: their
+                # duration is the readout length, which is reported with
+                # less precision than the gate lengths, hence the
+                # rounding. Resets have no duration in the backend
+                # properties at all and must be seeded through the
+                # gate_lengths_dt table.
+                if name == "measure":
+                    duration = to_dt_rounded(
+                        readout_length(qubit_indices[0]), unit="s", dt=dt)
+                elif name == "reset":
+                    raise QiskitError(
+                        "The backend properties do not report a duration "
+                        "for 'reset'; provide one through the "
+                        "gate_lengths_dt table.")
+                else:
+                    duration = to_dt_assert_exact(
+                        gate_length(name, list(qubit_indices)),
+                        unit="s", dt=dt)
+                duration_dt_cache[key] = duration
+            return duration
+
+        return _duration_dt
+
+    def run(self, dag: DAGCircuit) -> DAGCircuit:
+        """Run the pass on the given DAG.
+
+        Args:
+            dag: the DAG circuit to schedule.
+
+        Returns:
+            DAGCircuit: a scheduled DAG circuit without barriers.
+        """
+        clear_qarg_indices_cache()
+        qubits = dag.qubits
+        num_qubits = len(qubits)
+
+        nodes = list(dag.topological_op_nodes())
+        alap = self._scheduling_method == "alap"
+        if alap:
+            nodes.reverse()
+
+        # Hoist the values used in the flattening loop to locals: the
+        # loop body runs once per operation and LOAD_FAST is noticeably
+        # cheaper than repeated LOAD_ATTR on large circuits.
+        dt = self._dt
+        _duration_dt = self._make_duration_dt()
+
+        # The scheduling scan itself is pure integer arithmetic, so it
+        # is flattened into contiguous int64 arrays and handed to the
+        # (optionally numba-compiled) kernel: on wide and deep circuits
+        # the per-node Python interpretation of the scan was the
+        # dominating cost. Barriers are described to the kernel as
+        # zero-duration operations, which is exactly the alignment they
+        # imply.
+        num_ops = len(nodes)
+        flat_qubit_ids = []
+        extend_qubit_ids = flat_qubit_ids.extend
+        qubit_offsets = np.empty(num_ops + 1, dtype=np.int64)
+        durations_dt = np.empty(num_ops, dtype=np.int64)
+        for op_index, node in enumerate(nodes):
+            name = node.name
+            involved_qubits_indices = qarg_indices(node)
+            qubit_offsets[op_index] = len(flat_qubit_ids)
+            extend_qubit_ids(involved_qubits_indices)
+            if name == "barrier":
+                durations_dt[op_index] = 0
+            elif name == "delay":
+                op = node.op
+                durations_dt[op_index] = to_dt_rounded(
+                    op.duration, op.unit, dt)
+            else:
+                durations_dt[op_index] = _duration_dt(
+                    name, involved_qubits_indices)
+        qubit_offsets[num_ops] = len(flat_qubit_ids)
+        qubit_ids = np.asarray(flat_qubit_ids, dtype=np.int64)
+
+        event_op, event_qubit, event_dt, num_events = schedule_delays(
+            qubit_ids, qubit_offsets, durations_dt, num_qubits)
+
+        # Replay the event stream: operations are accumulated as plain
+        # (op, qargs, cargs) tuples and applied to a fresh
+        # QuantumCircuit in a single batch, which is much cheaper than
+        # crossing into the DAG machinery per node. Barriers are
+        # dropped, their synchronisation being realised by the
+        # inserted delays.
+        scheduled_ops = []
+        append_op = scheduled_ops.append
+        event_index = 0
+        for op_index, node in enumerate(nodes):
+            while event_index < num_events and \
+                    event_op[event_index] == op_index:
+                append_op((Delay(int(event_dt[event_index]), unit="dt"),
+                           [qubits[event_qubit[event_index]]], []))
+                event_index += 1
+            if node.name != "barrier":
+                append_op((node.op, node.qargs, node.cargs))
+        while event_index < num_events:
+            append_op((Delay(int(event_dt[event_index]), unit="dt"),
+                       [qubits[event_qubit[event_index]]], []))
+            event_index += 1
+        return self._build_output_dag(dag, scheduled_ops, alap)
+
+    @staticmethod
+    def _build_output_dag(dag: DAGCircuit, scheduled_ops: list,
+                          alap: bool) -> DAGCircuit:
+        """Build the output DAG from the accumulated operations.
+
+        Args:
+            dag: the DAG circuit the pass was run on.
+            scheduled_ops: the scheduled (op, qargs, cargs) tuples, in
+                insertion order.
+            alap: whether the operations were accumulated in reverse
+                (as-late-as-possible scheduling).
+
+        Returns:
+            DAGCircuit: the scheduled DAG circuit.
+        """
+        if alap:
+            scheduled_ops.reverse()
+        output_circuit = QuantumCircuit(*dag.qregs.values(),
+                                        *dag.cregs.values(),
+                                        name=dag.name,
+                                        global_phase=dag.global_phase)
+        # The metadata and pulse calibrations of the input DAG are
+        # carried over explicitly, as MergeDelaysPass does through
+        # copy_empty_like(): circuit_to_dag() propagates them from the
+        # circuit, so attaching them here keeps the rebuilt DAG a
+        # faithful copy of the input.
+        output_circuit.metadata = dag.metadata
+        output_circuit.calibrations = dag.calibrations
+        append = output_circuit.append
+        for op, op_qargs, op_cargs in scheduled_ops:
+            append(op, op_qargs, op_cargs)
+        return circuit_to_dag(output_circuit)
+
+
+class BarriersToDelaysAndMergePass(BarriersToDelaysPass):
+    """Schedule the circuit, replacing barriers with merged delays.
+
+    This pass fuses :class:`BarriersToDelaysPass` and
+    :class:`~qiskit.ignis.mitigation.dd.MergeDelaysPass`: instead of
+    materialising every idle period as its own delay and merging them
+    in a second DAG traversal, idle time is accumulated per qubit and
+    only flushed, as a single :class:`~qiskit.circuit.Delay`, right
+    before the next operation on that qubit. This halves the number of
+    DAG traversals and avoids creating intermediate delay nodes that
+    would immediately be collapsed.
+    """
+
+    def run(self, dag: DAGCircuit) -> DAGCircuit:
+        """Run the pass on the given DAG.
+
+        Args:
+            dag: the DAG circuit to schedule.
+
+        Returns:
+            DAGCircuit: a scheduled DAG circuit without barriers and
+            with merged delays.
+        """
+        clear_qarg_indices_cache()
+        qubits = dag.qubits
+        num_qubits = len(qubits)
+        times_dt = [0] * num_qubits
+        pending_delays_dt = [0] * num_qubits
+
+        nodes = list(dag.topological_op_nodes())
+        alap = self._scheduling_method == "alap"
+        if alap:
+            nodes.reverse()
+
+        scheduled_ops = []
+        append_op = scheduled_ops.append
+
+        dt = self._dt
+        _duration_dt = self._make_duration_dt()
+
+        for node in nodes:
+            name = node.name
+            involved_qubits_indices = qarg_indices(node)
+            if name == "barrier":
+                max_time_dt = max(times_dt[i] for i in involved_qubits_indices)
+                for qubit_index in involved_qubits_indices:
+                    pending_delays_dt[qubit_index] += \
+                        max_time_dt - times_dt[qubit_index]
+                    times_dt[qubit_index] = max_time_dt
+                continue
+            if name == "delay":
+                op = node.op
+                delay_dt = to_dt_rounded(op.duration, op.unit, dt)
+                qubit_index = involved_qubits_indices[0]
+                pending_delays_dt[qubit_index] += delay_dt
+                times_dt[qubit_index] += delay_dt
+                continue
+            node_execution_time_dt = _duration_dt(
+                name, involved_qubits_indices)
+            start_time_dt = max(times_dt[i] for i in involved_qubits_indices)
+            for qubit_index in involved_qubits_indices:
+                pending_delay_dt = pending_delays_dt[qubit_index] + \
+                    start_time_dt - times_dt[qubit_index]
+                if pending_delay_dt:
+                    append_op((Delay(pending_delay_dt, unit="dt"),
+                               [qubits[qubit_index]], []))
+                    pending_delays_dt[qubit_index] = 0
+            append_op((node.op, node.qargs, node.cargs))
+            for qubit_index in involved_qubits_indices:
+                times_dt[qubit_index] = start_time_dt + node_execution_time_dt
+
+        max_time_dt = max(times_dt)
+        for qubit_index, time_dt in enumerate(times_dt):
+            pending_delay_dt = pending_delays_dt[qubit_index] + \
+                max_time_dt - time_dt
+            if pending_delay_dt:
+                append_op((Delay(pending_delay_dt, unit="dt"),
+                           [qubits[qubit_index]], []))
+        return self._build_output_dag(dag, scheduled_ops, alap)
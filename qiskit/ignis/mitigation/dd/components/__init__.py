@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Components dynamical decoupling sequences are built from.
+"""
+
+from .base import (BaseDynamicalDecouplingComponent,
+                   ComponentNotScalableError)
+from .delay import DEFAULT_DELAY, DynamicalDecouplingDelayComponent
+from .gate import DynamicalDecouplingGateComponent, gate_component
+from .pulse import DynamicalDecouplingPulseComponent
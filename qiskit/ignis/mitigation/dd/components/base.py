@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Base class for dynamical decoupling sequence components.
+"""
+
+from abc import ABC, abstractmethod
+from copy import copy
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from qiskit import QuantumCircuit
+from qiskit.exceptions import QiskitError
+
+
+class ComponentNotScalableError(QiskitError):
+    """Raised when trying to scale a component of fixed duration."""
+
+
+class BaseDynamicalDecouplingComponent(ABC):
+    """An element of a dynamical decoupling sequence.
+
+    A component is either a pulse of fixed duration (such as a gate)
+    or a scalable idle period. A sequence is built by concatenating
+    components, the scalable ones being stretched to fill the idle
+    time the sequence should cover.
+    """
+
+    def __init__(self,
+                 durations_map: Callable[[Tuple[int, ...]], int],
+                 is_scalable: bool = False):
+        """Initialise the component.
+
+        Args:
+            durations_map: a callable returning the duration of the
+                component in ``dt``, given the physical qubit indices
+                it is applied on.
+            is_scalable: whether the duration of the component can be
+                changed with :meth:`scale_to`.
+        """
+        self._durations_map = durations_map
+        self._is_scalable = is_scalable
+
+    @property
+    def is_scalable(self) -> bool:
+        """Whether the duration of the component can be changed."""
+        return self._is_scalable
+
+    def duration(self, qargs: Tuple[int, ...]) -> int:
+        """Duration of the component in ``dt`` on the given qubits.
+
+        Args:
+            qargs: the physical qubit indices the component is
+                applied on.
+
+        Returns:
+            int: the duration of the component in ``dt``.
+        """
+        return self._durations_map(tuple(qargs))
+
+    def durations_batch(self, qubits: np.ndarray) -> np.ndarray:
+        """Durations of the component on each of the given qubits.
+
+        Vectorised counterpart of :meth:`duration` for one-qubit
+        components, letting callers that need the duration on every
+        qubit of a device work with a single array instead of a
+        Python loop per qubit. Subclasses with a cheap bulk lookup
+        override it.
+
+        Args:
+            qubits: the physical qubit indices, one per entry.
+
+        Returns:
+            np.ndarray: int64 array of the per-qubit durations in
+            ``dt``.
+        """
+        durations_map = self._durations_map
+        return np.fromiter((durations_map((int(qubit),)) for qubit in qubits),
+                           dtype=np.int64, count=len(qubits))
+
+    def scale_to(self, duration_dt: int) -> "BaseDynamicalDecouplingComponent":
+        """Return a copy of the component lasting ``duration_dt``.
+
+        Args:
+            duration_dt: the duration of the returned component
+                in ``dt``.
+
+        Returns:
+            BaseDynamicalDecouplingComponent: the scaled component.
+
+        Raises:
+            ComponentNotScalableError: if the component is not
+                scalable.
+        """
+        if not self._is_scalable:
+            raise ComponentNotScalableError(
+                "'{}' instances have a fixed duration and cannot be "
+                "scaled.".format(type(self).__name__))
+        # Only the durations map changes when scaling: a shallow copy
+        # is enough and avoids deep-copying the (potentially large)
+        # circuit or schedule held by the component.
+        scaled_component = copy(self)
+        scaled_component._durations_map = lambda qargs: duration_dt
+        return scaled_component
+
+    @abstractmethod
+    def apply(self, circuit: QuantumCircuit, qargs: Tuple[int, ...],
+              qubits: List[int]):
+        """Append the component to the given circuit.
+
+        Args:
+            circuit: the circuit the component is appended to.
+            qargs: the physical qubit indices the component is
+                applied on.
+            qubits: the circuit wires the component is appended on.
+        """
+
+    def _append_raw(self, circuit: QuantumCircuit, qargs: Tuple[int, ...],
+                    qubits: List[int]):
+        """Append the component, bypassing the circuit validation.
+
+        Fast path used by the sequence builders, which append the same
+        already-validated instructions over and over: subclasses
+        override it to push directly into ``circuit._data``, skipping
+        the broadcasting and register checks of
+        :meth:`QuantumCircuit.append`. The default implementation
+        falls back to :meth:`apply`.
+
+        Args:
+            circuit: the circuit the component is appended to.
+            qargs: the physical qubit indices the component is
+                applied on.
+            qubits: the circuit wires the component is appended on.
+        """
+        self.apply(circuit, qargs, qubits)
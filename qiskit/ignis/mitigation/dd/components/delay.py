@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Delay-based dynamical decoupling sequence component.
+"""
+
+from functools import lru_cache
+from typing import List, Tuple
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Delay
+
+from .base import BaseDynamicalDecouplingComponent
+
+
+class DynamicalDecouplingDelayComponent(BaseDynamicalDecouplingComponent):
+    """A dynamical decoupling component idling for a scalable duration."""
+
+    def __init__(self, duration_dt: int = 0):
+        """Initialise the component.
+
+        Args:
+            duration_dt: the duration of the delay in ``dt``.
+        """
+        super().__init__(lambda qargs: duration_dt, is_scalable=True)
+        self._duration_dt = duration_dt
+
+    def scale_to(self,
+                 duration_dt: int) -> "DynamicalDecouplingDelayComponent":
+        """Return a delay component lasting ``duration_dt``.
+
+        Args:
+            duration_dt: the duration of the returned component
+                in ``dt``.
+
+        Returns:
+            DynamicalDecouplingDelayComponent: the scaled component,
+            shared between calls requesting the same duration.
+        """
+        return _scaled_delay_component(duration_dt)
+
+    def apply(self, circuit: QuantumCircuit, qargs: Tuple[int, ...],
+              qubits: List[int]):
+        """Append the delay to the given circuit.
+
+        Args:
+            circuit: the circuit the delay is appended to.
+            qargs: the physical qubit indices the delay is applied on.
+            qubits: the circuit wires the delay is appended on.
+        """
+        circuit.append(Delay(self._duration_dt, unit="dt"), qubits)
+
+    def _append_raw(self, circuit: QuantumCircuit, qargs: Tuple[int, ...],
+                    qubits: List[int]):
+        """Append the delay directly to ``circuit._data``.
+
+        Args:
+            circuit: the circuit the delay is appended to.
+            qargs: the physical qubit indices the delay is applied on.
+            qubits: the circuit wires the delay is appended on.
+        """
+        circuit._data.append((Delay(self._duration_dt, unit="dt"),
+                              [circuit.qubits[qubit] for qubit in qubits],
+                              []))
+
+
+# Delay components are immutable and duration-only, and the scheduler
+# rounding keeps the distinct durations of a transpilation run in a
+# small set, so the scaled instances are shared instead of being
+# reconstructed for every delay of every sequence circuit.
+@lru_cache(maxsize=4096)
+def _scaled_delay_component(
+        duration_dt: int) -> DynamicalDecouplingDelayComponent:
+    """Return the shared delay component of the given duration."""
+    return DynamicalDecouplingDelayComponent(duration_dt)
+
+
+# The zero-duration delay has no qubit- or sequence-specific state and
+# scale_to() returns a shared immutable instance, so every sequence can
+# use this single placeholder instead of allocating its own.
+DEFAULT_DELAY = DynamicalDecouplingDelayComponent()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Gate-based dynamical decoupling sequence component.
+"""
+
+from typing import Dict, List, Tuple
+from weakref import WeakKeyDictionary
+
+from qiskit import QuantumCircuit
+from qiskit.exceptions import QiskitError
+from qiskit.providers.models import BackendProperties
+from qiskit.providers.models.backendconfiguration import BackendConfiguration
+
+from .base import BaseDynamicalDecouplingComponent
+from .._backend_ctx import backend_ctx
+from .._utils import (_translation_cache, get_circuit_duration, to_dt_rounded,
+                      translate_circuit_to_basis)
+
+
+class DynamicalDecouplingGateComponent(BaseDynamicalDecouplingComponent):
+    """A dynamical decoupling component applying a named gate.
+
+    The gate is unrolled to the basis gate set of the backend at
+    construction time so that its duration can be recovered from the
+    backend properties.
+    """
+
+    def __init__(self, gate_name: str,
+                 configuration: BackendConfiguration,
+                 properties: BackendProperties):
+        """Initialise the component.
+
+        Args:
+            gate_name: name of the gate to apply, e.g. ``"x"``.
+            configuration: configuration of the backend the component
+                will be executed on.
+            properties: properties of the same backend.
+
+        Raises:
+            QiskitError: if ``gate_name`` is not a known gate name.
+        """
+        cache_key = (gate_name, tuple(sorted(configuration.basis_gates)))
+        unrolled_circuit = _translation_cache.get(cache_key)
+        if unrolled_circuit is None:
+            gate_circuit = QuantumCircuit(1, name=gate_name)
+            if not hasattr(gate_circuit, gate_name):
+                raise QiskitError(
+                    "Unknown gate name '{}'.".format(gate_name))
+            getattr(gate_circuit, gate_name)(0)
+            unrolled_circuit = translate_circuit_to_basis(
+                gate_circuit, configuration.basis_gates)
+            _translation_cache[cache_key] = unrolled_circuit
+        dt = configuration.dt
+        # The duration of the component only depends on the physical
+        # qubits it is applied on, so the circuit-duration computation
+        # (which walks the unrolled circuit) is only done once per
+        # qargs and memoised afterwards.
+        duration_cache: Dict[Tuple[int, ...], int] = {}
+
+        def _durations_map(qargs: Tuple[int, ...]) -> int:
+            duration = duration_cache.get(qargs)
+            if duration is None:
+                duration = to_dt_rounded(
+                    *get_circuit_duration(unrolled_circuit, properties,
+                                          qargs),
+                    dt)
+                duration_cache[qargs] = duration
+            return duration
+
+        super().__init__(_durations_map)
+        self._circuit = unrolled_circuit
+
+    def apply(self, circuit: QuantumCircuit, qargs: Tuple[int, ...],
+              qubits: List[int]):
+        """Append the unrolled gate to the given circuit.
+
+        Args:
+            circuit: the circuit the gate is appended to.
+            qargs: the physical qubit indices the gate is applied on.
+            qubits: the circuit wires the gate is appended on.
+        """
+        circuit.compose(self._circuit, qubits=qubits, inplace=True)
+
+    def _append_raw(self, circuit: QuantumCircuit, qargs: Tuple[int, ...],
+                    qubits: List[int]):
+        """Append the unrolled gate directly to ``circuit._data``.
+
+        Args:
+            circuit: the circuit the gate is appended to.
+            qargs: the physical qubit indices the gate is applied on.
+            qubits: the circuit wires the gate is appended on.
+        """
+        # The unrolled circuit acts on a single qubit, so every
+        # instruction is remapped to the (single) target wire.
+        target_qargs = [circuit.qubits[qubits[0]]]
+        data = circuit._data
+        for instruction, _, _ in self._circuit.data:
+            data.append((instruction, target_qargs, []))
+        circuit.global_phase += self._circuit.global_phase
+
+
+# Gate components are immutable once built, so one instance per
+# (backend, gate name) pair can be shared by every sequence built on
+# that backend. The cache is keyed weakly on the backend: fetching
+# backend.properties() can be expensive (a remote call on IBMQ
+# backends) and should not be repeated per sequence construction, but
+# the cache must not keep disposed backends alive either.
+_gate_components_cache: \
+    "WeakKeyDictionary[object, Dict[str, DynamicalDecouplingGateComponent]]" \
+    = WeakKeyDictionary()
+
+
+def gate_component(backend, gate_name: str) -> DynamicalDecouplingGateComponent:
+    """Return the shared gate component of a backend.
+
+    Args:
+        backend: the backend the component is built for.
+        gate_name: name of the gate to apply, e.g. ``"x"``.
+
+    Returns:
+        DynamicalDecouplingGateComponent: the component, shared by
+        every caller asking for the same backend and gate.
+
+    Raises:
+        QiskitError: if ``gate_name`` is not a known gate name.
+    """
+    backend_components = _gate_components_cache.get(backend)
+    if backend_components is None:
+        backend_components = _gate_components_cache[backend] = {}
+    component = backend_components.get(gate_name)
+    if component is None:
+        ctx = backend_ctx(backend)
+        component = DynamicalDecouplingGateComponent(
+            gate_name, ctx.configuration, ctx.properties)
+        backend_components[gate_name] = component
+    return component
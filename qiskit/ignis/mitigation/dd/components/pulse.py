@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Pulse-based dynamical decoupling sequence component.
+"""
+
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Gate
+from qiskit.pulse import Schedule, ScheduleBlock
+
+from .base import BaseDynamicalDecouplingComponent
+
+
+class DynamicalDecouplingPulseComponent(BaseDynamicalDecouplingComponent):
+    """A dynamical decoupling component applying a calibrated gate.
+
+    The component wraps a gate along with one pulse schedule per
+    physical qubit; the matching calibration is attached to the
+    circuit when the component is applied.
+    """
+
+    def __init__(self, gate: Gate,
+                 calibrations: Dict[Tuple[int, ...],
+                                    Union[Schedule, ScheduleBlock]]):
+        """Initialise the component.
+
+        Args:
+            gate: the gate the calibrations implement.
+            calibrations: a mapping from physical qubit indices to the
+                pulse schedule implementing the gate on these qubits.
+        """
+        durations = {qubits: schedule.duration
+                     for qubits, schedule in calibrations.items()}
+        super().__init__(durations.__getitem__)
+        self._durations = durations
+        self._gate = gate
+        self._calibrations = calibrations
+
+    def durations_batch(self, qubits: np.ndarray) -> np.ndarray:
+        """Durations of the calibrated gate on each of the given qubits.
+
+        Args:
+            qubits: the physical qubit indices, one per entry.
+
+        Returns:
+            np.ndarray: int64 array of the per-qubit durations in
+            ``dt``.
+        """
+        durations = self._durations
+        return np.fromiter((durations[(int(qubit),)] for qubit in qubits),
+                           dtype=np.int64, count=len(qubits))
+
+    def apply(self, circuit: QuantumCircuit, qargs: Tuple[int, ...],
+              qubits: List[int]):
+        """Append the calibrated gate to the given circuit.
+
+        Args:
+            circuit: the circuit the gate is appended to.
+            qargs: the physical qubit indices the gate is applied on.
+            qubits: the circuit wires the gate is appended on.
+        """
+        circuit.append(self._gate, qubits)
+        qargs = tuple(qargs)
+        circuit.add_calibration(self._gate, qargs,
+                                self._calibrations[qargs])
+
+    def _append_raw(self, circuit: QuantumCircuit, qargs: Tuple[int, ...],
+                    qubits: List[int]):
+        """Append the calibrated gate directly to ``circuit._data``.
+
+        Args:
+            circuit: the circuit the gate is appended to.
+            qargs: the physical qubit indices the gate is applied on.
+            qubits: the circuit wires the gate is appended on.
+        """
+        circuit._data.append((self._gate,
+                              [circuit.qubits[qubit] for qubit in qubits],
+                              []))
+        circuit.add_calibration(self._gate, qargs,
+                                self._calibrations[qargs])
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Pass manager inserting dynamical decoupling sequences in a circuit.
+"""
+
+from typing import Dict, Tuple
+
+from qiskit.providers.models import BackendProperties
+from qiskit.transpiler import PassManager
+
+from ._utils import to_dt_rounded
+from .barriers_to_delays import BarriersToDelaysAndMergePass
+from .delay_to_dd_sequence import DelayToDynamicalDecouplingSequencePass
+from .flag_fundamental_state_operations import FlagFundamentalStateOperations
+
+
+def gate_lengths_table(properties: BackendProperties,
+                       dt: float) -> Dict[Tuple[str, Tuple[int, ...]], int]:
+    """Precompute the duration in ``dt`` of every backend gate.
+
+    The table is computed once per pass-manager construction and
+    shared by all the passes of the pipeline, so the hot scheduling
+    loops pay a single dict lookup per gate instead of walking the
+    backend properties and re-converting seconds to ``dt``.
+
+    Args:
+        properties: properties of the backend.
+        dt: duration of a backend sample in seconds.
+
+    Returns:
+        dict: a mapping from ``(gate name, qubits)`` to the gate
+        duration in ``dt``.
+    """
+    table = {}
+    for gate in properties.gates:
+        for parameter in gate.parameters:
+            if parameter.name == "gate_length":
+                table[(gate.gate, tuple(gate.qubits))] = to_dt_rounded(
+                    parameter.value, parameter.unit, dt)
+                break
+    return table
+
+
+def get_dd_pass_manager(backend, sequence,
+                        scheduling_method: str = "asap") -> PassManager:
+    """Build a pass manager inserting the given sequence in a circuit.
+
+    The returned pass manager schedules the circuit, converts its
+    barriers and idle periods to merged delays and substitutes the
+    delays that are long enough (and act on qubits that left the
+    fundamental state) with the given dynamical decoupling sequence.
+
+    Args:
+        backend: the backend the circuit will be executed on.
+        sequence: the dynamical decoupling sequence to insert.
+        scheduling_method: either ``"asap"`` or ``"alap"``.
+
+    Returns:
+        PassManager: the dynamical decoupling pass manager.
+    """
+    configuration = backend.configuration()
+    properties = backend.properties()
+    dt = configuration.dt
+    return PassManager([
+        BarriersToDelaysAndMergePass(
+            properties, dt, scheduling_method,
+            gate_lengths_dt=gate_lengths_table(properties, dt)),
+        # The analysis must run on the scheduled DAG so that the node
+        # identities it records are the ones the insertion pass sees.
+        FlagFundamentalStateOperations(),
+        DelayToDynamicalDecouplingSequencePass(sequence, dt),
+    ])
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Transpiler pass replacing delays with dynamical decoupling sequences.
+"""
+
+from qiskit.circuit import Delay
+from qiskit.converters import circuit_to_dag
+from qiskit.dagcircuit import DAGCircuit
+from qiskit.transpiler.basepasses import TransformationPass
+
+from ._utils import clear_qarg_indices_cache, qarg_indices, to_dt_rounded
+from .flag_fundamental_state_operations import FlagFundamentalStateOperations
+
+
+class DelayToDynamicalDecouplingSequencePass(TransformationPass):
+    """Replace idle periods with a dynamical decoupling sequence.
+
+    Each :class:`~qiskit.circuit.Delay` long enough to host the given
+    sequence is substituted, in place, by the sequence stretched to
+    the duration of the delay. Delays on qubits flagged as still being
+    in the fundamental state by
+    :class:`~qiskit.ignis.mitigation.dd.FlagFundamentalStateOperations`
+    are left untouched, since they need no decoupling.
+
+    Only the delay nodes are visited: the rest of the DAG is never
+    materialised as Python node objects nor rebuilt, which matters on
+    circuits where delays are a small fraction of the operations.
+    """
+
+    def __init__(self, sequence, dt: float):
+        """Initialise the pass.
+
+        Args:
+            sequence: the dynamical decoupling sequence inserted in
+                place of the delays. Any object providing the
+                ``can_be_used_on_duration(duration_dt, qargs)`` and
+                ``circuit(duration_dt, qargs)`` methods of
+                dynamical decoupling sequences is accepted.
+            dt: duration of a backend sample in seconds.
+        """
+        super().__init__()
+        self._sequence = sequence
+        self._dt = dt
+
+    def run(self, dag: DAGCircuit) -> DAGCircuit:
+        """Run the pass on the given DAG.
+
+        Args:
+            dag: the DAG circuit to insert sequences into.
+
+        Returns:
+            DAGCircuit: the DAG circuit with dynamical decoupling
+            sequences in place of the long-enough delays.
+        """
+        clear_qarg_indices_cache()
+        fundamental_state_flags = self.property_set[
+            FlagFundamentalStateOperations.PROPERTY_SET_KEY]
+        node_ordinals = self.property_set[
+            FlagFundamentalStateOperations.ORDINALS_PROPERTY_SET_KEY]
+        sequence = self._sequence
+        dt = self._dt
+        # Scheduled circuits contain many delays sharing the same
+        # duration and qubit (e.g. idle slots between fixed-length
+        # gates), so the sequence DAG is built once per distinct
+        # (duration, qargs) pair. A value of None records that the
+        # sequence cannot be used on that pair, sparing the repeated
+        # can_be_used_on_duration() calls as well.
+        dd_dag_cache = {}
+
+        for node in dag.op_nodes(op=Delay):
+            if fundamental_state_flags is not None and \
+                    fundamental_state_flags[node_ordinals[id(node)]]:
+                continue
+            op = node.op
+            duration_dt = to_dt_rounded(op.duration, op.unit, dt)
+            qargs_indices = qarg_indices(node)
+            key = (duration_dt, qargs_indices)
+            if key in dd_dag_cache:
+                dd_dag = dd_dag_cache[key]
+            else:
+                if sequence.can_be_used_on_duration(duration_dt,
+                                                    qargs_indices):
+                    dd_dag = circuit_to_dag(
+                        sequence.circuit(duration_dt, qargs_indices))
+                else:
+                    dd_dag = None
+                dd_dag_cache[key] = dd_dag
+            if dd_dag is not None:
+                dag.substitute_node_with_dag(node, dd_dag)
+        return dag
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Analysis pass flagging operations acting on qubits in the fundamental state.
+"""
+
+from qiskit.dagcircuit import DAGCircuit
+from qiskit.transpiler.basepasses import AnalysisPass
+
+from ._utils import clear_qarg_indices_cache, qarg_indices
+
+# Operations that do not take a qubit out of the fundamental state.
+_IDENTITY_OPERATIONS = frozenset(("id", "delay", "barrier"))
+
+
+class FlagFundamentalStateOperations(AnalysisPass):
+    """Flag operations applied on qubits still in the fundamental state.
+
+    Dynamical decoupling is useless (and wasteful) on qubits that are
+    still in the fundamental state :math:`|0\\rangle`: idle periods on
+    such qubits do not need to be protected. This pass records, for
+    each operation, whether all the qubits it acts on are guaranteed
+    to still be in the fundamental state when it starts.
+
+    The result is stored in
+    ``property_set[FlagFundamentalStateOperations.PROPERTY_SET_KEY]``
+    as a :class:`bytearray` indexed by the topological ordinal of the
+    node; the ordinals themselves are stored in
+    ``property_set[FlagFundamentalStateOperations.ORDINALS_PROPERTY_SET_KEY]``
+    as a mapping from ``id(node)`` to the ordinal. Downstream passes
+    iterating the same DAG thus read a flag with one dict hit and one
+    O(1) array access instead of hashing node identities into an
+    ever-growing dict of boxed booleans.
+    """
+
+    PROPERTY_SET_KEY = "fundamental_state_operations"
+    ORDINALS_PROPERTY_SET_KEY = "fundamental_state_operations_ordinals"
+
+    def run(self, dag: DAGCircuit):
+        """Run the pass on the given DAG.
+
+        Args:
+            dag: the DAG circuit to analyse.
+        """
+        clear_qarg_indices_cache()
+        flags = self.property_set[self.PROPERTY_SET_KEY] = bytearray()
+        ordinals = self.property_set[self.ORDINALS_PROPERTY_SET_KEY] = {}
+        append_flag = flags.append
+        # Qubit membership is tracked with a set so that the per-node
+        # checks and updates are single C-level set operations instead
+        # of Python-level generator loops.
+        fundamental_qubits = set(range(len(dag.qubits)))
+        identity_operations = _IDENTITY_OPERATIONS
+
+        for ordinal, node in enumerate(dag.topological_op_nodes()):
+            ordinals[id(node)] = ordinal
+            qubit_indices = set(qarg_indices(node))
+            name = node.name
+            if name == "reset":
+                append_flag(qubit_indices.issubset(fundamental_qubits))
+                fundamental_qubits |= qubit_indices
+            elif name in identity_operations:
+                append_flag(qubit_indices.issubset(fundamental_qubits))
+            else:
+                append_flag(False)
+                fundamental_qubits -= qubit_indices
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Transpiler pass merging consecutive delays on the same qubit.
+"""
+
+from array import array
+
+from qiskit.circuit import Delay
+from qiskit.dagcircuit import DAGCircuit
+from qiskit.transpiler.basepasses import TransformationPass
+
+from ._utils import clear_qarg_indices_cache, qarg_indices, to_dt_float
+
+
+class MergeDelaysPass(TransformationPass):
+    """Combine consecutive delays on the same qubit into one delay.
+
+    Delays accumulated on a qubit are only flushed when a non-delay
+    operation is applied on that qubit, so any run of consecutive
+    delays collapses into a single :class:`~qiskit.circuit.Delay`
+    expressed in ``dt``.
+    """
+
+    def __init__(self, dt: float):
+        """Initialise the pass.
+
+        Args:
+            dt: duration of a backend sample in seconds, used to
+                convert delays that are not expressed in ``dt``.
+        """
+        super().__init__()
+        self._dt = dt
+
+    def run(self, dag: DAGCircuit) -> DAGCircuit:
+        """Run the pass on the given DAG.
+
+        Args:
+            dag: the DAG circuit to simplify.
+
+        Returns:
+            DAGCircuit: an equivalent DAG circuit with merged delays.
+        """
+        clear_qarg_indices_cache()
+        # copy_empty_like() is the public way of getting an empty DAG
+        # with the same registers, metadata and global phase, and it
+        # avoids the extra state copies of the private
+        # _copy_circuit_metadata().
+        output_dag_circuit = dag.copy_empty_like()
+        qubits = output_dag_circuit.qubits
+        # Pending delays are integer dt counts: keeping them in a
+        # contiguous int64 array avoids boxing a float per delay and
+        # rounding on every flush.
+        delay_times_dt = array("q", [0] * len(qubits))
+        dt = self._dt
+
+        for node in dag.topological_op_nodes():
+            involved_qubits_indices = qarg_indices(node)
+            if node.name == "delay":
+                op = node.op
+                qubit_index = involved_qubits_indices[0]
+                delay_times_dt[qubit_index] += int(round(to_dt_float(
+                    op.duration, op.unit, dt)))
+                continue
+            for qubit_index in involved_qubits_indices:
+                pending_delay_dt = delay_times_dt[qubit_index]
+                if pending_delay_dt:
+                    output_dag_circuit.apply_operation_back(
+                        Delay(pending_delay_dt, unit="dt"),
+                        qargs=[qubits[qubit_index]], cargs=[])
+                    delay_times_dt[qubit_index] = 0
+            output_dag_circuit.apply_operation_back(
+                node.op, qargs=node.qargs, cargs=node.cargs)
+
+        for qubit_index, pending_delay_dt in enumerate(delay_times_dt):
+            if pending_delay_dt:
+                output_dag_circuit.apply_operation_back(
+                    Delay(pending_delay_dt, unit="dt"),
+                    qargs=[qubits[qubit_index]], cargs=[])
+        return output_dag_circuit
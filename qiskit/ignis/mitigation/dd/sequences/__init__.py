@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Ready-to-use dynamical decoupling sequences.
+"""
+
+from .base import BaseDynamicalDecouplingSequence
+from .carr_purcell import (BaseCarrPurcellDynamicalDecouplingSequence,
+                           CarrPurcellDynamicalDecouplingSequence,
+                           CPMGGateDynamicalDecouplingSequence,
+                           CPMGPulseDynamicalDecouplingSequence)
+from .hahn import (BaseHahnSpinEchoDynamicalDecouplingSequence,
+                   HahnSpinEchoDynamicalDecouplingSequence,
+                   HahnSpinEchoPreRotatedDynamicalDecouplingSequence,
+                   HahnSpinEchoPulseDynamicalDecouplingSequence)
+from .kdd import XY4KDDDynamicalDecouplingSequence
+from .uhrig import (BaseUhrigDynamicalDecouplingSequence,
+                    BaseUhrigXPreRotationDynamicalDecouplingSequence,
+                    UhrigGateDynamicalDecouplingSequence,
+                    UhrigPulseDynamicalDecouplingSequence)
+from .xy4 import (BaseXY4DynamicalDecouplingSequence,
+                  XY4DynamicalDecouplingSequence,
+                  XY4PulseDynamicalDecouplingSequence)
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Shared cache of phase-shifted pulse calibrations.
+"""
+
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple, Union
+from weakref import WeakKeyDictionary
+
+from qiskit.pulse import Schedule, ScheduleBlock, ShiftPhase
+from qiskit.pulse.instructions import Call
+from qiskit.pulse.transforms import AlignLeft
+
+from .._backend_ctx import backend_ctx
+
+# Building the calibrations of a phase-shifted pulse walks every qubit
+# of the backend and enters a pulse builder context per qubit, which is
+# by far the dominating cost of constructing a pulse-based dynamical
+# decoupling sequence. The result only depends on the backend, the
+# phase and the schedule name, so it is built once and shared by every
+# sequence needing it. The cached mapping is wrapped in a
+# MappingProxyType: callers get a read-only shared view. The cache is
+# keyed weakly on the backend so that collected backends do not keep
+# their calibrations alive.
+_calibrations_cache: \
+    "WeakKeyDictionary[object, Dict[Tuple[float, str], Mapping]]" = \
+    WeakKeyDictionary()
+
+
+def clear_calibrations_cache():
+    """Empty the phase-shifted calibrations cache."""
+    _calibrations_cache.clear()
+
+
+def phase_wrapped_x_calibrations(
+        backend, phase: float, name: str
+) -> Mapping[Tuple[int, ...], Union[Schedule, ScheduleBlock]]:
+    """Calibrations of an X pulse conjugated by frame shifts.
+
+    For every qubit of the backend, the returned mapping contains a
+    schedule shifting the drive frame by ``phase``, playing the
+    backend-calibrated X pulse and shifting the frame back. Up to a
+    global phase this implements a :math:`\\pi` rotation around the
+    axis at angle ``phase`` of the equatorial plane (``phase = pi/2``
+    gives a Y pulse).
+
+    Args:
+        backend: the backend the calibrations are built for.
+        phase: the frame shift, in radians, applied around the X pulse.
+        name: name given to the built schedules.
+
+    Returns:
+        Mapping: a read-only mapping from one-qubit ``qargs`` tuples to
+        the corresponding schedule, shared between all the sequences
+        built on the same backend.
+    """
+    backend_calibrations = _calibrations_cache.get(backend)
+    if backend_calibrations is None:
+        backend_calibrations = _calibrations_cache[backend] = {}
+    key = (phase, name)
+    calibrations = backend_calibrations.get(key)
+    if calibrations is None:
+        ctx = backend_ctx(backend)
+        num_qubits = ctx.num_qubits
+        drive_channels = ctx.drive_channels
+        default_x_calibrations = ctx.default_x_calibrations
+        built_calibrations = {}
+        # The qubit scan stays serial on purpose: the schedule
+        # assembly below is GIL-bound pure Python, so a thread pool
+        # would only add dispatch overhead, and the per-backend cache
+        # makes the loop a one-shot cost anyway.
+        for qubit_index in range(num_qubits):
+            channel = drive_channels[qubit_index]
+            default_x_calibration = default_x_calibrations[qubit_index]
+            # The calibration is assembled as a ScheduleBlock with a
+            # left alignment: unlike Schedule composition, appending
+            # to a block does not recompute timeslots per instruction,
+            # so the three appends stay O(1) each. The X pulse is
+            # referenced through a Call instead of being merged into
+            # a flat schedule.
+            schedule = ScheduleBlock(name=name,
+                                     alignment_context=AlignLeft())
+            schedule.append(ShiftPhase(phase, channel), inplace=True)
+            schedule.append(Call(default_x_calibration), inplace=True)
+            schedule.append(ShiftPhase(-phase, channel), inplace=True)
+            built_calibrations[(qubit_index,)] = schedule
+        calibrations = MappingProxyType(built_calibrations)
+        backend_calibrations[key] = calibrations
+    return calibrations
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Base class for dynamical decoupling sequences.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from qiskit import QuantumCircuit
+from qiskit.exceptions import QiskitError
+
+from .._scheduling_kernel import partition_durations, partition_durations_int
+from ..components.base import BaseDynamicalDecouplingComponent
+
+# Upper bound on the number of built circuits kept per sequence: after
+# scheduler rounding the distinct (duration, qargs) pairs form a small
+# set, but long-running transpiler sessions should not grow the cache
+# without limit.
+_CIRCUIT_CACHE_MAX_SIZE = 1024
+
+
+class BaseDynamicalDecouplingSequence:
+    """A dynamical decoupling sequence.
+
+    A sequence is an ordered list of
+    :class:`~qiskit.ignis.mitigation.dd.components.BaseDynamicalDecouplingComponent`
+    instances, each either of fixed duration (typically a gate or a
+    calibrated pulse) or scalable (typically a delay). When the
+    sequence is stretched to a given total duration, the idle time left
+    once the fixed components are accounted for is split between the
+    scalable components proportionally to their relative scales.
+    """
+
+    # Sequences are instantiated in tight DD-sweep loops (one per
+    # repetition number and variant), so instances carry slots
+    # instead of a per-instance __dict__.
+    __slots__ = ("_sequence", "_relative_scales", "_total_scale",
+                 "_ops", "_idle_fractions", "_integer_scales",
+                 "_int_scales", "_int_total_scale", "_has_fixed",
+                 "_fixed_durations_dt_cache", "_circuit_cache")
+
+    def __init__(self,
+                 sequence: Sequence[BaseDynamicalDecouplingComponent],
+                 relative_scales: Union[Sequence[Optional[float]],
+                                        np.ndarray]):
+        """Initialise the sequence.
+
+        Args:
+            sequence: the components of the sequence, in order.
+            relative_scales: for each component, the relative share of
+                the idle time it absorbs, or ``None`` for components
+                of fixed duration; alternatively a float64 array
+                carrying ``NaN`` in the fixed-component slots, which
+                lets callers pass precomputed templates without
+                per-element boxing. Must have the same length as
+                ``sequence`` and be consistent with the components'
+                :attr:`is_scalable` flags.
+
+        Raises:
+            QiskitError: if ``sequence`` and ``relative_scales`` have
+                different lengths or if a scale is given (resp.
+                missing) for a non-scalable (resp. scalable)
+                component.
+        """
+        # The scales are normalised to a contiguous float64 array with
+        # NaN marking the fixed components, whatever form the caller
+        # used: all the derived quantities below then come from array
+        # reductions instead of per-element None checks.
+        if isinstance(relative_scales, np.ndarray):
+            scales = np.asarray(relative_scales, dtype=np.float64)
+        else:
+            scales = np.asarray(
+                [np.nan if scale is None else scale
+                 for scale in relative_scales], dtype=np.float64)
+        if len(sequence) != scales.shape[0]:
+            raise QiskitError(
+                "The sequence ({} components) and its relative scales "
+                "({} values) should have the same length.".format(
+                    len(sequence), scales.shape[0]))
+        scalable_mask = ~np.isnan(scales)
+        for component, is_scalable in zip(sequence, scalable_mask):
+            if component.is_scalable != bool(is_scalable):
+                raise QiskitError(
+                    "Scalable components should be given a relative "
+                    "scale and non-scalable components should not.")
+        self._sequence = list(sequence)
+        self._relative_scales = scales
+        # The quantities below only depend on the sequence composition,
+        # which is fixed at construction time, so they are computed
+        # once here instead of on every can_be_used_on_duration() or
+        # circuit() call: both are invoked once per delay of the
+        # scheduled circuit.
+        scalable_scales = scales[scalable_mask]
+        self._total_scale = float(scalable_scales.sum())
+        # The component list is repackaged as (component, idle fraction)
+        # pairs, the fraction being None for fixed components and
+        # already divided by the total scale otherwise: the circuit()
+        # loop is then a straight scan with a single None check per
+        # component, with no zip, mask lookup or division left in the
+        # hot path.
+        self._ops: List[Tuple[BaseDynamicalDecouplingComponent,
+                              Optional[float]]] = []
+        for component, scale, is_scalable in zip(self._sequence, scales,
+                                                 scalable_mask):
+            if is_scalable:
+                self._ops.append((component, float(scale) /
+                                  self._total_scale))
+            else:
+                self._ops.append((component, None))
+        # The scalable fractions are also kept as a contiguous float64
+        # array consumed by the (optionally numba-compiled) partition
+        # kernel.
+        self._idle_fractions = scalable_scales / self._total_scale
+        # All the Carr-Purcell-style templates use small integer
+        # scales; for these the idle time is partitioned with exact
+        # integer arithmetic instead of float multiplies and round().
+        self._integer_scales = bool(
+            np.all(scalable_scales == np.floor(scalable_scales)))
+        if self._integer_scales:
+            self._int_scales = scalable_scales.astype(np.int64)
+            self._int_total_scale = int(self._int_scales.sum())
+        # The fixed duration only depends on the qubits the sequence
+        # is applied on, so it is memoised per qargs.
+        self._has_fixed = any(not component.is_scalable
+                              for component in self._sequence)
+        self._fixed_durations_dt_cache: Dict[Tuple[int, ...], int] = {}
+        # Built circuits, memoised per (duration, qargs) with a small
+        # least-recently-used eviction policy.
+        self._circuit_cache: \
+            "OrderedDict[Tuple[int, Tuple[int, ...]], QuantumCircuit]" = \
+            OrderedDict()
+
+    def fixed_duration_dt(self, qargs: Tuple[int, ...]) -> int:
+        """Duration in ``dt`` of the non-scalable components.
+
+        Args:
+            qargs: the physical qubit indices the sequence is applied
+                on.
+
+        Returns:
+            int: the summed duration, in ``dt``, of the components of
+            fixed duration.
+        """
+        qargs = tuple(qargs)
+        duration_dt = self._fixed_durations_dt_cache.get(qargs)
+        if duration_dt is None:
+            duration_dt = sum(component.duration(qargs)
+                              for component in self._sequence
+                              if not component.is_scalable)
+            self._fixed_durations_dt_cache[qargs] = duration_dt
+        return duration_dt
+
+    def fixed_durations_for_all_qubits(
+            self, qubit_indices: np.ndarray) -> np.ndarray:
+        """Fixed duration of the sequence on each of the given qubits.
+
+        Vectorised counterpart of :meth:`fixed_duration_dt`: the
+        per-component durations are gathered as arrays and summed with
+        a single reduction, instead of one Python loop per qubit. The
+        per-qargs memo is seeded with the results.
+
+        Args:
+            qubit_indices: the physical qubit indices, one per entry.
+
+        Returns:
+            np.ndarray: int64 array of the per-qubit fixed durations
+            in ``dt``.
+        """
+        qubit_indices = np.asarray(qubit_indices)
+        fixed_components = [component for component in self._sequence
+                            if not component.is_scalable]
+        if not fixed_components:
+            return np.zeros(len(qubit_indices), dtype=np.int64)
+        durations_dt = np.add.reduce(
+            [component.durations_batch(qubit_indices)
+             for component in fixed_components])
+        cache = self._fixed_durations_dt_cache
+        for qubit_index, duration_dt in zip(qubit_indices, durations_dt):
+            cache[(int(qubit_index),)] = int(duration_dt)
+        return durations_dt
+
+    def _cache_circuit(self, key: Tuple[int, Tuple[int, ...]],
+                       sequence_circuit: QuantumCircuit):
+        """Insert a built circuit in the per-sequence cache.
+
+        Applies the least-recently-used eviction keeping the cache
+        below ``_CIRCUIT_CACHE_MAX_SIZE``; every :meth:`circuit`
+        implementation (including the specialised overrides) must
+        insert through this helper so the cap is enforced uniformly.
+
+        Args:
+            key: the ``(duration, qargs)`` pair the circuit was built
+                for.
+            sequence_circuit: the built circuit.
+        """
+        circuit_cache = self._circuit_cache
+        circuit_cache[key] = sequence_circuit
+        if len(circuit_cache) > _CIRCUIT_CACHE_MAX_SIZE:
+            circuit_cache.popitem(last=False)
+
+    def can_be_used_on_duration(self, duration_dt: int,
+                                qargs: Tuple[int, ...]) -> bool:
+        """Check that the sequence fits in the given duration.
+
+        Args:
+            duration_dt: the duration, in ``dt``, the sequence should
+                be stretched to.
+            qargs: the physical qubit indices the sequence would be
+                applied on.
+
+        Returns:
+            bool: whether the sequence can be stretched to the given
+            duration.
+        """
+        # Sequences without fixed components fit any positive
+        # duration; this is checked once per scheduled delay, so the
+        # cached-duration path is skipped entirely for them.
+        if not self._has_fixed:
+            return duration_dt > 0
+        return duration_dt >= self.fixed_duration_dt(qargs)
+
+    def circuit(self, total_duration_dt: int,
+                qargs: Tuple[int, ...]) -> QuantumCircuit:
+        """Build the sequence stretched to the given total duration.
+
+        Args:
+            total_duration_dt: the duration, in ``dt``, the built
+                circuit should last.
+            qargs: the physical qubit indices the sequence is applied
+                on.
+
+        Returns:
+            QuantumCircuit: a one-qubit circuit of the requested
+            duration implementing the sequence. The circuit is shared
+            between calls requesting the same duration and qubits and
+            should be treated as read-only.
+        """
+        qargs = tuple(qargs)
+        # Scheduled circuits request the same few (duration, qargs)
+        # pairs over and over, so the built circuits are memoised:
+        # repeated calls are a dict hit instead of an O(components)
+        # rebuild.
+        key = (total_duration_dt, qargs)
+        circuit_cache = self._circuit_cache
+        cached_circuit = circuit_cache.get(key)
+        if cached_circuit is not None:
+            circuit_cache.move_to_end(key)
+            return cached_circuit
+        idle_duration_dt = total_duration_dt - self.fixed_duration_dt(qargs)
+        # The idle time is partitioned between the scalable components
+        # by a prefix-sum rounding kernel (numba-compiled when the
+        # 'jit' extra is installed), which guarantees the durations sum
+        # to the idle time exactly. Integer scales take the pure
+        # integer-arithmetic variant.
+        if self._integer_scales:
+            scalable_durations_dt = partition_durations_int(
+                self._int_scales, idle_duration_dt, self._int_total_scale)
+        else:
+            scalable_durations_dt = partition_durations(
+                self._idle_fractions, idle_duration_dt)
+        scalable_index = 0
+
+        sequence_circuit = QuantumCircuit(1, name="dd_sequence")
+        # The raw-append fast path skips the per-instruction
+        # broadcasting and register validation of QuantumCircuit.append:
+        # every instruction appended here is already known to fit the
+        # one-qubit circuit.
+        for component, idle_fraction in self._ops:
+            if idle_fraction is not None:
+                component = component.scale_to(
+                    int(scalable_durations_dt[scalable_index]))
+                scalable_index += 1
+            component._append_raw(sequence_circuit, qargs, [0])
+
+        self._cache_circuit(key, sequence_circuit)
+        return sequence_circuit
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Carr-Purcell and Carr-Purcell-Meiboom-Gill dynamical decoupling sequences.
+"""
+
+from math import pi
+from typing import Optional
+
+from qiskit.circuit import Gate
+
+from ..components import (BaseDynamicalDecouplingComponent,
+                          DEFAULT_DELAY,
+                          DynamicalDecouplingPulseComponent,
+                          gate_component)
+from ._pulse_cache import phase_wrapped_x_calibrations
+from .base import BaseDynamicalDecouplingSequence
+
+
+class BaseCarrPurcellDynamicalDecouplingSequence(
+        BaseDynamicalDecouplingSequence):
+    """Base class for the Carr-Purcell family of sequences.
+
+    The sequence is ``repetition_number`` equally-spaced :math:`\\pi`
+    pulses, the idle time before the first and after the last pulse
+    being half the inter-pulse spacing. Optional pre- and
+    post-rotations can be prepended and appended, for instance to
+    rotate the protected state onto the axis of the pulses.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, pi_component: BaseDynamicalDecouplingComponent,
+                 repetition_number: int,
+                 pre_rotation: Optional[
+                     BaseDynamicalDecouplingComponent] = None,
+                 post_rotation: Optional[
+                     BaseDynamicalDecouplingComponent] = None):
+        """Initialise the sequence.
+
+        Args:
+            pi_component: the component implementing the repeated
+                :math:`\\pi` pulse.
+            repetition_number: number of :math:`\\pi` pulses.
+            pre_rotation: optional component applied before the
+                sequence.
+            post_rotation: optional component applied after the
+                sequence.
+        """
+        delay = DEFAULT_DELAY
+        # The component and scale lists are allocated once at their
+        # final size and filled in place: the previous concatenations
+        # re-allocated and copied the whole sequence several times,
+        # which is noticeable for the deep repetition numbers CPMG is
+        # typically used with.
+        pre_offset = 1 if pre_rotation is not None else 0
+        num_components = 2 * repetition_number + 1
+        total_length = num_components + pre_offset + \
+            (1 if post_rotation is not None else 0)
+        sequence = [delay] * total_length
+        relative_scales = [None] * total_length
+        if pre_rotation is not None:
+            sequence[0] = pre_rotation
+        relative_scales[pre_offset] = 1
+        for repetition in range(repetition_number):
+            pulse_index = pre_offset + 1 + 2 * repetition
+            sequence[pulse_index] = pi_component
+            relative_scales[pulse_index + 1] = 2
+        relative_scales[pre_offset + num_components - 1] = 1
+        if post_rotation is not None:
+            sequence[-1] = post_rotation
+        super().__init__(sequence, relative_scales)
+
+
+class CarrPurcellDynamicalDecouplingSequence(
+        BaseCarrPurcellDynamicalDecouplingSequence):
+    """Carr-Purcell sequence of X gates.
+
+    The :math:`\\pi` pulses are X gates unrolled to the basis of the
+    backend.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, backend, repetition_number: int):
+        """Initialise the sequence.
+
+        Args:
+            backend: the backend the sequence will be executed on.
+            repetition_number: number of :math:`\\pi` pulses.
+        """
+        super().__init__(gate_component(backend, "x"), repetition_number)
+
+
+class CPMGGateDynamicalDecouplingSequence(
+        BaseCarrPurcellDynamicalDecouplingSequence):
+    """Carr-Purcell-Meiboom-Gill sequence of Y gates.
+
+    The :math:`\\pi` pulses are Y gates unrolled to the basis of the
+    backend.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, backend, repetition_number: int):
+        """Initialise the sequence.
+
+        Args:
+            backend: the backend the sequence will be executed on.
+            repetition_number: number of :math:`\\pi` pulses.
+        """
+        super().__init__(gate_component(backend, "y"), repetition_number)
+
+
+class CPMGPulseDynamicalDecouplingSequence(
+        BaseCarrPurcellDynamicalDecouplingSequence):
+    """Carr-Purcell-Meiboom-Gill sequence of calibrated Y pulses.
+
+    The :math:`\\pi` pulses are Y pulses built from the
+    backend-calibrated X pulse conjugated by :math:`\\pi/2` frame
+    shifts, avoiding the extra single-qubit gates a basis translation
+    would introduce.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, backend, repetition_number: int):
+        """Initialise the sequence.
+
+        Args:
+            backend: the backend the sequence will be executed on.
+            repetition_number: number of :math:`\\pi` pulses.
+        """
+        y_calibrations = phase_wrapped_x_calibrations(backend, pi / 2, "y")
+        super().__init__(
+            DynamicalDecouplingPulseComponent(Gate("y", 1, []),
+                                              y_calibrations),
+            repetition_number)
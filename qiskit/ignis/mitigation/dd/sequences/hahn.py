@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Hahn spin-echo dynamical decoupling sequences.
+"""
+
+from math import pi
+from typing import Optional, Tuple
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Gate
+
+from ..components import (BaseDynamicalDecouplingComponent,
+                          DEFAULT_DELAY,
+                          DynamicalDecouplingPulseComponent,
+                          gate_component)
+from ._pulse_cache import phase_wrapped_x_calibrations
+from .carr_purcell import BaseCarrPurcellDynamicalDecouplingSequence
+
+
+class BaseHahnSpinEchoDynamicalDecouplingSequence(
+        BaseCarrPurcellDynamicalDecouplingSequence):
+    """Base class for the Hahn spin-echo variants.
+
+    A Hahn echo is the one-repetition Carr-Purcell sequence: a single
+    :math:`\\pi` pulse framed by two delays of equal scale. The shape
+    is fixed, so :meth:`circuit` is specialised to split the idle time
+    in two halves directly instead of running the generic idle-time
+    partition.
+    """
+
+    __slots__ = ("_pi_component", "_pre_rotation", "_post_rotation")
+
+    def __init__(self, pi_component: BaseDynamicalDecouplingComponent,
+                 pre_rotation: Optional[
+                     BaseDynamicalDecouplingComponent] = None,
+                 post_rotation: Optional[
+                     BaseDynamicalDecouplingComponent] = None):
+        """Initialise the sequence.
+
+        Args:
+            pi_component: the component implementing the central
+                :math:`\\pi` pulse.
+            pre_rotation: optional component applied before the echo.
+            post_rotation: optional component applied after the echo.
+        """
+        super().__init__(pi_component, 1, pre_rotation, post_rotation)
+        self._pi_component = pi_component
+        self._pre_rotation = pre_rotation
+        self._post_rotation = post_rotation
+
+    def circuit(self, total_duration_dt: int,
+                qargs: Tuple[int, ...]) -> QuantumCircuit:
+        """Build the echo stretched to the given total duration.
+
+        Args:
+            total_duration_dt: the duration, in ``dt``, the built
+                circuit should last.
+            qargs: the physical qubit indices the sequence is applied
+                on.
+
+        Returns:
+            QuantumCircuit: a one-qubit circuit of the requested
+            duration implementing the echo, shared between calls and
+            to be treated as read-only.
+        """
+        qargs = tuple(qargs)
+        key = (total_duration_dt, qargs)
+        circuit_cache = self._circuit_cache
+        cached_circuit = circuit_cache.get(key)
+        if cached_circuit is not None:
+            circuit_cache.move_to_end(key)
+            return cached_circuit
+
+        idle_duration_dt = total_duration_dt - self.fixed_duration_dt(qargs)
+        half_dt = idle_duration_dt // 2
+        sequence_circuit = QuantumCircuit(1, name="dd_sequence")
+        if self._pre_rotation is not None:
+            self._pre_rotation._append_raw(sequence_circuit, qargs, [0])
+        DEFAULT_DELAY.scale_to(half_dt)._append_raw(
+            sequence_circuit, qargs, [0])
+        self._pi_component._append_raw(sequence_circuit, qargs, [0])
+        DEFAULT_DELAY.scale_to(idle_duration_dt - half_dt)._append_raw(
+            sequence_circuit, qargs, [0])
+        if self._post_rotation is not None:
+            self._post_rotation._append_raw(sequence_circuit, qargs, [0])
+
+        self._cache_circuit(key, sequence_circuit)
+        return sequence_circuit
+
+
+class HahnSpinEchoDynamicalDecouplingSequence(
+        BaseHahnSpinEchoDynamicalDecouplingSequence):
+    """Hahn spin echo: a single, centred :math:`\\pi` pulse.
+
+    This is the one-repetition Carr-Purcell sequence, the
+    :math:`\\pi` pulse being an X gate unrolled to the basis of the
+    backend.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, backend):
+        """Initialise the sequence.
+
+        Args:
+            backend: the backend the sequence will be executed on.
+        """
+        super().__init__(gate_component(backend, "x"))
+
+
+class HahnSpinEchoPulseDynamicalDecouplingSequence(
+        BaseHahnSpinEchoDynamicalDecouplingSequence):
+    """Hahn spin echo built from a calibrated Y pulse.
+
+    The :math:`\\pi` pulse is the backend-calibrated X pulse
+    conjugated by :math:`\\pi/2` frame shifts.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, backend):
+        """Initialise the sequence.
+
+        Args:
+            backend: the backend the sequence will be executed on.
+        """
+        y_calibrations = phase_wrapped_x_calibrations(backend, pi / 2, "y")
+        super().__init__(
+            DynamicalDecouplingPulseComponent(Gate("y", 1, []),
+                                              y_calibrations))
+
+
+class HahnSpinEchoPreRotatedDynamicalDecouplingSequence(
+        BaseHahnSpinEchoDynamicalDecouplingSequence):
+    """Hahn spin echo conjugated by :math:`\\pi/2` rotations.
+
+    A ``sx`` pre-rotation and ``sxdg`` post-rotation bracket the echo
+    so that states stored along the Z axis are protected.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, backend):
+        """Initialise the sequence.
+
+        Args:
+            backend: the backend the sequence will be executed on.
+        """
+        super().__init__(gate_component(backend, "x"),
+                         pre_rotation=gate_component(backend, "sx"),
+                         post_rotation=gate_component(backend, "sxdg"))
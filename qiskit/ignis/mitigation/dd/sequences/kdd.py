@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Knill dynamical decoupling (KDD) sequence.
+"""
+
+from math import pi
+from types import MappingProxyType
+from typing import Dict, Mapping
+from weakref import WeakKeyDictionary
+
+from qiskit.circuit import Gate
+from qiskit.pulse import Schedule, ShiftPhase
+
+from .._backend_ctx import backend_ctx
+from ..components import (DEFAULT_DELAY,
+                          DynamicalDecouplingPulseComponent)
+from .base import BaseDynamicalDecouplingSequence
+
+# Pulse phases of a KDD block, in units of pi/6: each block is five
+# pi pulses at phases (pi/6, 0, pi/2, 0, pi/6) relative to the block
+# phase. The full sequence alternates blocks at phases 0 and pi/2.
+_KDD_BLOCK_PATTERN = (1, 0, 3, 0, 1)
+_KDD_BLOCK_OFFSETS = (0, 3, 0, 3)
+# Distinct pulse phases of the full sequence, in units of pi/6.
+_KDD_PHASES = (0, 1, 3, 4, 6)
+
+# The per-backend KDD calibrations: building them scans every qubit
+# of the backend and is by far the dominating cost of constructing the
+# sequence, so the result is shared by all the KDD sequences built on
+# the same backend. The backend is a weak key so that its calibrations
+# are released with it.
+_kdd_calibrations_cache: \
+    "WeakKeyDictionary[object, Dict[int, Mapping]]" = WeakKeyDictionary()
+
+
+def _kdd_calibrations(backend) -> Dict[int, Mapping]:
+    """Build the phase-shifted pulse calibrations of a KDD sequence.
+
+    The backend qubits are scanned once, every phase of the sequence
+    being calibrated for every qubit, instead of one scan per phase.
+
+    Args:
+        backend: the backend the calibrations are built for.
+
+    Returns:
+        dict: a mapping from the pulse phase (in units of ``pi/6``) to
+        the read-only calibrations mapping of that phase.
+    """
+    calibrations = _kdd_calibrations_cache.get(backend)
+    if calibrations is None:
+        ctx = backend_ctx(backend)
+        num_qubits = ctx.num_qubits
+        drive_channels = ctx.drive_channels
+        default_x_calibrations = ctx.default_x_calibrations
+        built_calibrations = {phase_index: {}
+                              for phase_index in _KDD_PHASES}
+        # Scanning the qubits serially is deliberate: assembling the
+        # schedules is GIL-bound pure Python that threads cannot
+        # overlap, and the cache above already turns the scan into a
+        # one-shot cost per backend.
+        for qubit_index in range(num_qubits):
+            # The drive channel and the default X calibration are the
+            # same for every phase of the qubit: look them up once per
+            # qubit instead of once per built schedule.
+            channel = drive_channels[qubit_index]
+            default_x_calibration = default_x_calibrations[qubit_index]
+            qargs = (qubit_index,)
+            for phase_index in _KDD_PHASES:
+                phase = phase_index * pi / 6
+                # Assembled directly rather than through the pulse
+                # builder: the builder context costs more than the
+                # three appends of this schedule, five times per
+                # qubit here.
+                schedule = Schedule(
+                    name="kdd_x_{}pi_6".format(phase_index))
+                schedule += ShiftPhase(phase, channel)
+                schedule += default_x_calibration
+                schedule += ShiftPhase(-phase, channel)
+                built_calibrations[phase_index][qargs] = schedule
+        calibrations = {phase_index: MappingProxyType(phase_calibrations)
+                        for phase_index, phase_calibrations
+                        in built_calibrations.items()}
+        _kdd_calibrations_cache[backend] = calibrations
+    return calibrations
+
+
+class XY4KDDDynamicalDecouplingSequence(BaseDynamicalDecouplingSequence):
+    """Knill dynamical decoupling sequence.
+
+    Four blocks of five equally-spaced :math:`\\pi` pulses, each block
+    a composite pulse at phases :math:`(\\pi/6, 0, \\pi/2, 0, \\pi/6)`
+    relative to the block phase, the blocks alternating between the X
+    and Y axes in the XY4 pattern. The pulses are built from the
+    backend-calibrated X pulse conjugated by frame shifts.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, backend):
+        """Initialise the sequence.
+
+        Args:
+            backend: the backend the sequence will be executed on.
+        """
+        calibrations = _kdd_calibrations(backend)
+        pulse_components = {
+            phase_index: DynamicalDecouplingPulseComponent(
+                Gate("kdd_x_{}pi_6".format(phase_index), 1, []),
+                calibrations[phase_index])
+            for phase_index in _KDD_PHASES}
+        delay = DEFAULT_DELAY
+
+        sequence = [delay]
+        relative_scales = [1]
+        for block_offset in _KDD_BLOCK_OFFSETS:
+            for pulse_phase in _KDD_BLOCK_PATTERN:
+                sequence += [pulse_components[block_offset + pulse_phase],
+                             delay]
+                relative_scales += [None, 2]
+        relative_scales[-1] = 1
+        super().__init__(sequence, relative_scales)
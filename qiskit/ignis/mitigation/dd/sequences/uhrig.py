@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Uhrig dynamical decoupling sequences.
+"""
+
+from math import pi
+from typing import Optional
+
+import numpy as np
+
+from qiskit.circuit import Gate
+
+from .._scheduling_kernel import udd_scales
+from ..components import (BaseDynamicalDecouplingComponent,
+                          DEFAULT_DELAY,
+                          DynamicalDecouplingPulseComponent,
+                          gate_component)
+from ._pulse_cache import phase_wrapped_x_calibrations
+from .base import BaseDynamicalDecouplingSequence
+
+# The common Uhrig orders of a DD sweep draw their scales from a small
+# fixed set, so these are computed once at import time; other orders
+# fall back to the (optionally numba-compiled) kernel.
+_UDD_SCALES = {repetition_number: udd_scales(repetition_number)
+               for repetition_number in (2, 3, 4, 5, 6, 8, 10, 16, 32)}
+
+
+class BaseUhrigDynamicalDecouplingSequence(BaseDynamicalDecouplingSequence):
+    """Base class for the Uhrig family of sequences.
+
+    Unlike the equally-spaced Carr-Purcell pulses, the :math:`i`-th
+    :math:`\\pi` pulse of an Uhrig sequence is placed at the fraction
+    :math:`\\sin^2(\\pi i / (2 n))` of the protected duration, where
+    ``n`` is the repetition number, which suppresses dephasing to a
+    higher order for the same number of pulses. Optional pre- and
+    post-rotations can be prepended and appended.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, pi_component: BaseDynamicalDecouplingComponent,
+                 repetition_number: int,
+                 pre_rotation: Optional[
+                     BaseDynamicalDecouplingComponent] = None,
+                 post_rotation: Optional[
+                     BaseDynamicalDecouplingComponent] = None):
+        """Initialise the sequence.
+
+        Args:
+            pi_component: the component implementing the repeated
+                :math:`\\pi` pulse.
+            repetition_number: number of idle intervals; the sequence
+                contains ``repetition_number - 1`` :math:`\\pi` pulses.
+            pre_rotation: optional component applied before the
+                sequence.
+            post_rotation: optional component applied after the
+                sequence.
+        """
+        delay = DEFAULT_DELAY
+        offsets_scales = _UDD_SCALES.get(repetition_number)
+        if offsets_scales is None:
+            offsets_scales = udd_scales(repetition_number)
+        # The component and scale lists are allocated once at their
+        # final size and filled in place, as in the Carr-Purcell base:
+        # the previous extend loop built two temporary lists per pulse
+        # and re-grew the sequence repeatedly, which is noticeable for
+        # large repetition numbers.
+        pre_offset = 1 if pre_rotation is not None else 0
+        num_components = 2 * repetition_number - 1
+        total_length = num_components + pre_offset + \
+            (1 if post_rotation is not None else 0)
+        sequence = [delay] * total_length
+        # The scales are passed as a float64 array using NaN for the
+        # fixed-component slots, the form the base class consumes
+        # directly.
+        relative_scales = np.full(total_length, np.nan)
+        if pre_rotation is not None:
+            sequence[0] = pre_rotation
+        relative_scales[pre_offset] = offsets_scales[0]
+        for index in range(1, repetition_number):
+            pulse_index = pre_offset + 2 * index - 1
+            sequence[pulse_index] = pi_component
+            relative_scales[pulse_index + 1] = offsets_scales[index]
+        if post_rotation is not None:
+            sequence[-1] = post_rotation
+        super().__init__(sequence, relative_scales)
+
+
+class BaseUhrigXPreRotationDynamicalDecouplingSequence(
+        BaseUhrigDynamicalDecouplingSequence):
+    """Uhrig sequence with optional :math:`\\sqrt{X}` rotations.
+
+    When requested, a ``sx`` pre-rotation and ``sxdg`` post-rotation
+    bracket the sequence so that states stored along the Z axis are
+    protected by the Y pulses.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, backend,
+                 pi_component: BaseDynamicalDecouplingComponent,
+                 repetition_number: int,
+                 add_pre_post_rotations: bool = False):
+        """Initialise the sequence.
+
+        Args:
+            backend: the backend the sequence will be executed on.
+            pi_component: the component implementing the repeated
+                :math:`\\pi` pulse.
+            repetition_number: number of idle intervals.
+            add_pre_post_rotations: whether to bracket the sequence
+                with ``sx`` and ``sxdg`` rotations.
+        """
+        if add_pre_post_rotations:
+            # The rotation components are only built when requested,
+            # and then come from the per-backend cache so that
+            # repeated DD builds do not reinstantiate them.
+            pre_rotation = gate_component(backend, "sx")
+            post_rotation = gate_component(backend, "sxdg")
+        else:
+            pre_rotation, post_rotation = None, None
+        super().__init__(pi_component, repetition_number,
+                         pre_rotation=pre_rotation,
+                         post_rotation=post_rotation)
+
+
+class UhrigGateDynamicalDecouplingSequence(
+        BaseUhrigXPreRotationDynamicalDecouplingSequence):
+    """Uhrig sequence of Y gates.
+
+    The :math:`\\pi` pulses are Y gates unrolled to the basis of the
+    backend.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, backend, repetition_number: int,
+                 add_pre_post_rotations: bool = False):
+        """Initialise the sequence.
+
+        Args:
+            backend: the backend the sequence will be executed on.
+            repetition_number: number of idle intervals.
+            add_pre_post_rotations: whether to bracket the sequence
+                with ``sx`` and ``sxdg`` rotations.
+        """
+        super().__init__(backend, gate_component(backend, "y"),
+                         repetition_number, add_pre_post_rotations)
+
+
+class UhrigPulseDynamicalDecouplingSequence(
+        BaseUhrigXPreRotationDynamicalDecouplingSequence):
+    """Uhrig sequence of calibrated Y pulses.
+
+    The :math:`\\pi` pulses are Y pulses built from the
+    backend-calibrated X pulse conjugated by :math:`\\pi/2` frame
+    shifts, avoiding the extra single-qubit gates a basis translation
+    would introduce.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, backend, repetition_number: int,
+                 add_pre_post_rotations: bool = False):
+        """Initialise the sequence.
+
+        Args:
+            backend: the backend the sequence will be executed on.
+            repetition_number: number of idle intervals.
+            add_pre_post_rotations: whether to bracket the sequence
+                with ``sx`` and ``sxdg`` rotations.
+        """
+        y_calibrations = phase_wrapped_x_calibrations(
+            backend, pi / 2, "y")
+        super().__init__(
+            backend,
+            DynamicalDecouplingPulseComponent(Gate("y", 1, []),
+                                              y_calibrations),
+            repetition_number, add_pre_post_rotations)
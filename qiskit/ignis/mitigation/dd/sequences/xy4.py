@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+XY4 dynamical decoupling sequences.
+"""
+
+from math import pi
+
+import numpy as np
+
+from qiskit.circuit import Gate
+
+from ..components import (BaseDynamicalDecouplingComponent,
+                          DEFAULT_DELAY,
+                          DynamicalDecouplingPulseComponent,
+                          gate_component)
+from ._pulse_cache import phase_wrapped_x_calibrations
+from .base import BaseDynamicalDecouplingSequence
+
+
+class BaseXY4DynamicalDecouplingSequence(BaseDynamicalDecouplingSequence):
+    """Base class for the XY4 family of sequences.
+
+    Four equally-spaced :math:`\\pi` pulses alternating between the X
+    and Y axes, which decouples both dephasing and relaxation to first
+    order. In the symmetric variant the first and last delays last
+    half an inter-pulse spacing, making the sequence its own mirror
+    image.
+    """
+
+    __slots__ = ()
+
+    # The relative-scale patterns of the two variants are constants of
+    # the sequence shape, kept as read-only float64 templates (NaN
+    # marking the fixed components) that the base class consumes
+    # without converting or reboxing per construction.
+    _SYMMETRIC_SCALES = np.array(
+        [1 / 2, np.nan, 1, np.nan, 1, np.nan, 1, np.nan, 1 / 2])
+    _SYMMETRIC_SCALES.setflags(write=False)
+    _ASYMMETRIC_SCALES = np.array(
+        [1, np.nan, 1, np.nan, 1, np.nan, 1, np.nan])
+    _ASYMMETRIC_SCALES.setflags(write=False)
+
+    def __init__(self, x_component: BaseDynamicalDecouplingComponent,
+                 y_component: BaseDynamicalDecouplingComponent,
+                 symmetric: bool = True):
+        """Initialise the sequence.
+
+        Args:
+            x_component: the component implementing the X-axis
+                :math:`\\pi` pulse.
+            y_component: the component implementing the Y-axis
+                :math:`\\pi` pulse.
+            symmetric: whether to use the symmetric variant, with
+                half-spacing delays at both ends.
+        """
+        delay = DEFAULT_DELAY
+        # The two variants share the delay/X/delay/Y core: it is built
+        # once and the symmetric case only appends the trailing delay
+        # and picks its scale template, leaving a single
+        # super().__init__ call site instead of one per branch.
+        sequence = [delay, x_component, delay, y_component, delay,
+                    x_component, delay, y_component]
+        if symmetric:
+            sequence.append(delay)
+            relative_scales = self._SYMMETRIC_SCALES
+        else:
+            relative_scales = self._ASYMMETRIC_SCALES
+        super().__init__(sequence, relative_scales)
+
+
+class XY4DynamicalDecouplingSequence(BaseXY4DynamicalDecouplingSequence):
+    """XY4 sequence of X and Y gates.
+
+    The :math:`\\pi` pulses are X and Y gates unrolled to the basis of
+    the backend.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, backend, symmetric: bool = True):
+        """Initialise the sequence.
+
+        Args:
+            backend: the backend the sequence will be executed on.
+            symmetric: whether to use the symmetric variant, with
+                half-spacing delays at both ends.
+        """
+        super().__init__(gate_component(backend, "x"),
+                         gate_component(backend, "y"), symmetric)
+
+
+class XY4PulseDynamicalDecouplingSequence(BaseXY4DynamicalDecouplingSequence):
+    """XY4 sequence of X gates and calibrated Y pulses.
+
+    The Y pulses are built from the backend-calibrated X pulse
+    conjugated by :math:`\\pi/2` frame shifts, avoiding the extra
+    single-qubit gates a basis translation would introduce.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, backend, symmetric: bool = True):
+        """Initialise the sequence.
+
+        Args:
+            backend: the backend the sequence will be executed on.
+            symmetric: whether to use the symmetric variant, with
+                half-spacing delays at both ends.
+        """
+        y_calibrations = phase_wrapped_x_calibrations(
+            backend, pi / 2, "y")
+        super().__init__(
+            gate_component(backend, "x"),
+            DynamicalDecouplingPulseComponent(Gate("y", 1, []),
+                                              y_calibrations),
+            symmetric)
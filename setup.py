@@ -20,7 +20,10 @@ import sys
 
 requirements = [
     "numpy>=1.13",
-    "qiskit-terra>=0.13.0",
+    # The dynamical decoupling sub-module relies on ScheduleBlock,
+    # pulse Call/AlignLeft and DAGCircuit.copy_empty_like, all
+    # introduced in terra 0.17.
+    "qiskit-terra>=0.17.0",
     "retworkx>=0.8.0",
     "scipy>=0.19,!=0.19.1",
     "setuptools>=40.1.0",
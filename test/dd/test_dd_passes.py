@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Test the dynamical decoupling transpiler passes
+"""
+
+import unittest
+
+from qiskit import QuantumCircuit
+from qiskit.converters import circuit_to_dag, dag_to_circuit
+from qiskit.exceptions import QiskitError
+from qiskit.test.mock import FakeAthens
+from qiskit.transpiler import PassManager
+
+from qiskit.ignis.mitigation.dd import (
+    BarriersToDelaysAndMergePass, BarriersToDelaysPass,
+    DelayToDynamicalDecouplingSequencePass, FlagFundamentalStateOperations,
+    HahnSpinEchoDynamicalDecouplingSequence, MergeDelaysPass)
+from qiskit.ignis.mitigation.dd._utils import (to_dt_assert_exact,
+                                               to_dt_rounded)
+
+
+def _op_stream(circuit):
+    """Return the circuit operations as (name, duration, qubits) tuples.
+
+    The duration entry is the delay duration in ``dt`` for delay
+    operations and None otherwise.
+    """
+    stream = []
+    for instruction, qargs, _ in circuit.data:
+        duration_dt = instruction.duration \
+            if instruction.name == "delay" else None
+        stream.append((instruction.name, duration_dt,
+                       tuple(circuit.qubits.index(qubit)
+                             for qubit in qargs)))
+    return stream
+
+
+def _per_qubit_ops(circuit):
+    """Return, for each qubit, its (name, duration) operation stream."""
+    per_qubit = {index: [] for index in range(circuit.num_qubits)}
+    for name, duration_dt, qubit_indices in _op_stream(circuit):
+        for qubit_index in qubit_indices:
+            per_qubit[qubit_index].append((name, duration_dt))
+    return per_qubit
+
+
+class _FakeBackendTestCase(unittest.TestCase):
+    """Shared fake-backend fixtures of the pass tests."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.backend = FakeAthens()
+        cls.properties = cls.backend.properties()
+        cls.dt = cls.backend.configuration().dt
+        cls.x_dt = to_dt_assert_exact(
+            cls.properties.gate_length("x", [0]), "s", cls.dt)
+        cls.sx_dt = to_dt_assert_exact(
+            cls.properties.gate_length("sx", [0]), "s", cls.dt)
+        cls.measure_dt = to_dt_rounded(
+            cls.properties.readout_length(0), "s", cls.dt)
+
+    def _run_pass(self, transpiler_pass, circuit):
+        """Run a single pass on the given circuit."""
+        return dag_to_circuit(transpiler_pass.run(circuit_to_dag(circuit)))
+
+
+class TestBarriersToDelaysPass(_FakeBackendTestCase):
+    """Test the scheduling pass replacing barriers with delays."""
+
+    def test_asap_inserts_alignment_delay(self):
+        """Test that a two-qubit gate aligns its qubits with a delay."""
+        circuit = QuantumCircuit(2)
+        circuit.sx(0)
+        circuit.cx(0, 1)
+        scheduled = self._run_pass(
+            BarriersToDelaysPass(self.properties, self.dt), circuit)
+        self.assertEqual(_op_stream(scheduled),
+                         [("sx", None, (0,)),
+                          ("delay", self.sx_dt, (1,)),
+                          ("cx", None, (0, 1))])
+
+    def test_barriers_removed_and_realised_as_delays(self):
+        """Test that barriers disappear but keep their alignment."""
+        circuit = QuantumCircuit(2)
+        circuit.x(0)
+        circuit.barrier()
+        circuit.x(1)
+        scheduled = self._run_pass(
+            BarriersToDelaysPass(self.properties, self.dt), circuit)
+        stream = _op_stream(scheduled)
+        self.assertNotIn("barrier", [name for name, _, _ in stream])
+        # The barrier padding puts the second X at the end time of the
+        # first one, and the trailing padding then fills qubit 0 up to
+        # the circuit duration: both qubits last exactly two X gates.
+        per_qubit = _per_qubit_ops(scheduled)
+        self.assertEqual(per_qubit[0],
+                         [("x", None), ("delay", self.x_dt)])
+        self.assertEqual(per_qubit[1],
+                         [("delay", self.x_dt), ("x", None)])
+
+    def test_alap_postpones_idle_time(self):
+        """Test that ALAP scheduling idles before the operations."""
+        circuit = QuantumCircuit(2)
+        circuit.x(0)
+        circuit.x(0)
+        circuit.x(1)
+        asap = self._run_pass(
+            BarriersToDelaysPass(self.properties, self.dt,
+                                 scheduling_method="asap"), circuit)
+        alap = self._run_pass(
+            BarriersToDelaysPass(self.properties, self.dt,
+                                 scheduling_method="alap"), circuit)
+        self.assertEqual(_per_qubit_ops(asap)[1],
+                         [("x", None), ("delay", self.x_dt)])
+        self.assertEqual(_per_qubit_ops(alap)[1],
+                         [("delay", self.x_dt), ("x", None)])
+
+    def test_measure_duration_from_readout_length(self):
+        """Test that measurements are scheduled with their readout length."""
+        circuit = QuantumCircuit(2, 1)
+        circuit.x(0)
+        circuit.measure(0, 0)
+        scheduled = self._run_pass(
+            BarriersToDelaysPass(self.properties, self.dt), circuit)
+        self.assertEqual(_per_qubit_ops(scheduled)[1],
+                         [("delay", self.x_dt + self.measure_dt)])
+
+    def test_reset_is_rejected(self):
+        """Test that resets raise a clear error instead of crashing."""
+        circuit = QuantumCircuit(1)
+        circuit.reset(0)
+        with self.assertRaises(QiskitError):
+            self._run_pass(
+                BarriersToDelaysPass(self.properties, self.dt), circuit)
+
+
+class TestMergeDelaysPass(_FakeBackendTestCase):
+    """Test the delay-merging pass."""
+
+    def test_merges_consecutive_delays(self):
+        """Test that runs of delays collapse into a single delay."""
+        circuit = QuantumCircuit(1)
+        circuit.delay(10, 0, unit="dt")
+        circuit.delay(5, 0, unit="dt")
+        circuit.x(0)
+        circuit.delay(3, 0, unit="dt")
+        merged = self._run_pass(MergeDelaysPass(self.dt), circuit)
+        self.assertEqual(_op_stream(merged),
+                         [("delay", 15, (0,)), ("x", None, (0,)),
+                          ("delay", 3, (0,))])
+
+
+class TestBarriersToDelaysAndMergePass(_FakeBackendTestCase):
+    """Test the fused scheduling-and-merging pass."""
+
+    def test_matches_sequential_passes(self):
+        """Test the fused pass against scheduling followed by merging."""
+        circuit = QuantumCircuit(2)
+        circuit.sx(0)
+        circuit.barrier()
+        circuit.delay(7, 0, unit="dt")
+        circuit.x(1)
+        circuit.cx(0, 1)
+        fused = self._run_pass(
+            BarriersToDelaysAndMergePass(self.properties, self.dt), circuit)
+        sequential = PassManager(
+            [BarriersToDelaysPass(self.properties, self.dt),
+             MergeDelaysPass(self.dt)]).run(circuit)
+        self.assertEqual(_per_qubit_ops(fused), _per_qubit_ops(sequential))
+
+
+class TestDelayToDynamicalDecouplingSequencePass(_FakeBackendTestCase):
+    """Test the pass inserting sequences in place of delays."""
+
+    def _run_dd(self, circuit, sequence):
+        """Run the flagging and insertion passes on the circuit."""
+        return PassManager(
+            [FlagFundamentalStateOperations(),
+             DelayToDynamicalDecouplingSequencePass(sequence,
+                                                    self.dt)]).run(circuit)
+
+    def test_replaces_long_delay(self):
+        """Test that a long-enough delay hosts the echo."""
+        sequence = HahnSpinEchoDynamicalDecouplingSequence(self.backend)
+        delay_dt = 4 * self.x_dt
+        circuit = QuantumCircuit(1)
+        circuit.x(0)
+        circuit.delay(delay_dt, 0, unit="dt")
+        circuit.x(0)
+        decoupled = self._run_dd(circuit, sequence)
+        stream = _op_stream(decoupled)
+        # The original delay is replaced by the echo: its pi pulse plus
+        # two delays splitting the remaining idle time in halves.
+        self.assertEqual([name for name, _, _ in stream],
+                         ["x", "delay", "x", "delay", "x"])
+        idle_durations = [duration for name, duration, _ in stream
+                          if name == "delay"]
+        self.assertEqual(sum(idle_durations), delay_dt - self.x_dt)
+        self.assertLessEqual(abs(idle_durations[0] - idle_durations[1]), 1)
+
+    def test_skips_fundamental_state_delay(self):
+        """Test that delays on still-|0> qubits are left untouched."""
+        sequence = HahnSpinEchoDynamicalDecouplingSequence(self.backend)
+        delay_dt = 4 * self.x_dt
+        circuit = QuantumCircuit(1)
+        circuit.delay(delay_dt, 0, unit="dt")
+        circuit.x(0)
+        decoupled = self._run_dd(circuit, sequence)
+        self.assertEqual(_op_stream(decoupled),
+                         [("delay", delay_dt, (0,)), ("x", None, (0,))])
+
+    def test_skips_too_short_delay(self):
+        """Test that delays shorter than the echo are left untouched."""
+        sequence = HahnSpinEchoDynamicalDecouplingSequence(self.backend)
+        delay_dt = self.x_dt - 1
+        circuit = QuantumCircuit(1)
+        circuit.x(0)
+        circuit.delay(delay_dt, 0, unit="dt")
+        decoupled = self._run_dd(circuit, sequence)
+        self.assertEqual(_op_stream(decoupled),
+                         [("x", None, (0,)), ("delay", delay_dt, (0,))])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Test the dynamical decoupling sequence base class
+"""
+
+import unittest
+from typing import List, Tuple
+
+import numpy as np
+
+from qiskit import QuantumCircuit
+from qiskit.ignis.mitigation.dd.components import (
+    BaseDynamicalDecouplingComponent, DEFAULT_DELAY)
+from qiskit.ignis.mitigation.dd.sequences import (
+    BaseDynamicalDecouplingSequence)
+
+
+class _FixedTestComponent(BaseDynamicalDecouplingComponent):
+    """A fixed-duration component with a per-qubit duration table."""
+
+    def __init__(self, durations_dt: List[int]):
+        super().__init__(lambda qargs: durations_dt[qargs[0]])
+
+    def apply(self, circuit: QuantumCircuit, qargs: Tuple[int, ...],
+              qubits: List[int]):
+        """No-op: only the durations matter to these tests."""
+
+
+class TestFixedDurations(unittest.TestCase):
+    """Test the per-qargs and vectorised fixed-duration queries."""
+
+    _PI_DURATIONS_DT = [160, 162, 158, 164]
+    _ROTATION_DURATIONS_DT = [80, 81, 79, 82]
+
+    def _sequence(self) -> BaseDynamicalDecouplingSequence:
+        """Build an echo-shaped sequence with two fixed components."""
+        delay = DEFAULT_DELAY
+        return BaseDynamicalDecouplingSequence(
+            [_FixedTestComponent(self._ROTATION_DURATIONS_DT), delay,
+             _FixedTestComponent(self._PI_DURATIONS_DT), delay],
+            [None, 1, None, 1])
+
+    def test_batch_matches_per_qargs(self):
+        """Test the vectorised query against fixed_duration_dt."""
+        # Two separate instances so that neither query can answer from
+        # a cache seeded by the other.
+        per_qargs = [self._sequence().fixed_duration_dt((qubit,))
+                     for qubit in range(4)]
+        batch = self._sequence().fixed_durations_for_all_qubits(
+            np.arange(4))
+        self.assertEqual(list(batch), per_qargs)
+
+    def test_batch_seeds_memo(self):
+        """Test that the vectorised query seeds the per-qargs memo."""
+        sequence = self._sequence()
+        batch = sequence.fixed_durations_for_all_qubits(np.arange(4))
+        self.assertEqual(
+            sequence._fixed_durations_dt_cache,
+            {(qubit,): int(duration_dt)
+             for qubit, duration_dt in enumerate(batch)})
+
+    def test_batch_without_fixed_components(self):
+        """Test the all-scalable fast path returns zeros."""
+        sequence = BaseDynamicalDecouplingSequence([DEFAULT_DELAY], [1])
+        batch = sequence.fixed_durations_for_all_qubits(np.arange(3))
+        self.assertEqual(list(batch), [0, 0, 0])
+        self.assertEqual(batch.dtype, np.int64)
+
+
+if __name__ == "__main__":
+    unittest.main()
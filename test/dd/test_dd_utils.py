@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Test dynamical decoupling time conversion utilities
+"""
+
+import unittest
+
+from qiskit.exceptions import QiskitError
+from qiskit.ignis.mitigation.dd._utils import (to_seconds, to_dt_float,
+                                               to_dt_rounded,
+                                               to_dt_assert_exact)
+
+
+class TestTimeConversions(unittest.TestCase):
+    """Test the time conversion helpers of the dd sub-module."""
+
+    def test_to_seconds(self):
+        """Test conversion of the supported units to seconds."""
+        self.assertAlmostEqual(to_seconds(1.0, "s"), 1.0)
+        self.assertAlmostEqual(to_seconds(2.0, "ms"), 2e-3)
+        self.assertAlmostEqual(to_seconds(3.0, "us"), 3e-6)
+        self.assertAlmostEqual(to_seconds(4.0, "ns"), 4e-9)
+        self.assertAlmostEqual(to_seconds(5.0, "ps"), 5e-12)
+
+    def test_to_seconds_unknown_unit(self):
+        """Test that an unknown unit raises."""
+        with self.assertRaises(QiskitError):
+            to_seconds(1.0, "minutes")
+
+    def test_to_dt_float(self):
+        """Test conversion to a floating-point number of dt."""
+        self.assertAlmostEqual(to_dt_float(10, "dt", 1e-9), 10)
+        self.assertAlmostEqual(to_dt_float(35.5, "ns", 1e-9), 35.5)
+        self.assertAlmostEqual(to_dt_float(1e-6, "s", 2e-9), 500.0)
+
+    def test_to_dt_rounded(self):
+        """Test conversion to the closest integer number of dt."""
+        self.assertEqual(to_dt_rounded(35.4, "ns", 1e-9), 35)
+        self.assertEqual(to_dt_rounded(35.6, "ns", 1e-9), 36)
+
+    def test_to_dt_assert_exact(self):
+        """Test exact conversion to an integer number of dt."""
+        self.assertEqual(to_dt_assert_exact(160e-9, "s", 1e-9), 160)
+        # Values slightly below an integer multiple are accepted too.
+        self.assertEqual(to_dt_assert_exact(159.995e-9, "s", 1e-9), 160)
+        with self.assertRaises(QiskitError):
+            to_dt_assert_exact(160.5e-9, "s", 1e-9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Test the numerical scheduling kernel of the dd sub-module
+"""
+
+import unittest
+
+import numpy as np
+
+from qiskit.ignis.mitigation.dd._scheduling_kernel import (
+    schedule_delays, partition_durations, partition_durations_int,
+    udd_scales)
+
+
+def _flatten_ops(ops):
+    """Flatten (qubits, duration) pairs to the kernel input arrays."""
+    qubit_ids = []
+    qubit_offsets = [0]
+    durations_dt = []
+    for qubits, duration_dt in ops:
+        qubit_ids.extend(qubits)
+        qubit_offsets.append(len(qubit_ids))
+        durations_dt.append(duration_dt)
+    return (np.asarray(qubit_ids, dtype=np.int64),
+            np.asarray(qubit_offsets, dtype=np.int64),
+            np.asarray(durations_dt, dtype=np.int64))
+
+
+class TestScheduleDelays(unittest.TestCase):
+    """Test the as-soon-as-possible delay computation."""
+
+    @staticmethod
+    def _events(ops, num_qubits):
+        """Run the kernel and return the events as a list of tuples."""
+        qubit_ids, qubit_offsets, durations_dt = _flatten_ops(ops)
+        event_op, event_qubit, event_dt, num_events = schedule_delays(
+            qubit_ids, qubit_offsets, durations_dt, num_qubits)
+        return [(int(event_op[i]), int(event_qubit[i]), int(event_dt[i]))
+                for i in range(num_events)]
+
+    def test_hand_scheduled_circuit(self):
+        """Test against a hand-scheduled three-qubit circuit."""
+        # q0: [2-dt gate] then a 2-qubit 10-dt gate with q1, which is
+        # busy until t=5: q0 idles for 3 dt first. q2 runs a 4-dt gate
+        # and then idles until the circuit ends at t=15.
+        events = self._events(
+            [((0,), 2), ((1,), 5), ((0, 1), 10), ((2,), 4)], 3)
+        self.assertEqual(events, [(2, 0, 3), (4, 2, 11)])
+
+    def test_barrier_alignment(self):
+        """Test that zero-duration operations align their qubits."""
+        # A barrier is described as a zero-duration operation on all
+        # the qubits: q1 and q2 must be padded up to q0's clock before
+        # it, and the 1-dt gate on q2 then leaves q0 and q1 idle.
+        events = self._events(
+            [((0,), 5), ((1,), 2), ((0, 1, 2), 0), ((2,), 1)], 3)
+        self.assertEqual(events, [(2, 1, 3), (2, 2, 5), (4, 0, 1),
+                                  (4, 1, 1)])
+
+    def test_aligned_circuit_has_no_events(self):
+        """Test that a perfectly packed circuit needs no delay."""
+        events = self._events([((0,), 3), ((1,), 3), ((0, 1), 2)], 2)
+        self.assertEqual(events, [])
+
+
+class TestPartitionDurations(unittest.TestCase):
+    """Test the idle-duration partition kernels."""
+
+    def test_exact_sum(self):
+        """Test that the partitioned durations sum to the idle time."""
+        fractions = np.asarray([0.3, 0.2, 0.4, 0.1])
+        for idle_duration_dt in range(0, 50):
+            durations_dt = partition_durations(fractions, idle_duration_dt)
+            self.assertEqual(int(durations_dt.sum()), idle_duration_dt)
+
+    def test_exact_sum_on_ties(self):
+        """Test the exactness guarantee on rounding ties."""
+        # Halving an odd duration puts every cumulative target exactly
+        # on a .5 tie; whichever way round() resolves it, the total
+        # must still be exact.
+        fractions = np.asarray([0.5, 0.5])
+        for idle_duration_dt in (1, 3, 5, 7, 1001):
+            durations_dt = partition_durations(fractions, idle_duration_dt)
+            self.assertEqual(int(durations_dt.sum()), idle_duration_dt)
+
+    def test_proportionality(self):
+        """Test that each duration stays within 1 dt of its target."""
+        fractions = np.asarray([0.125, 0.25, 0.25, 0.25, 0.125])
+        durations_dt = partition_durations(fractions, 1000)
+        for duration_dt, fraction in zip(durations_dt, fractions):
+            self.assertLessEqual(abs(duration_dt - 1000 * fraction), 1)
+
+    def test_int_exact_sum(self):
+        """Test the integer variant sums to the idle time exactly."""
+        scales = np.asarray([1, 2, 2, 1], dtype=np.int64)
+        for idle_duration_dt in range(0, 50):
+            durations_dt = partition_durations_int(scales, idle_duration_dt,
+                                                   6)
+            self.assertEqual(int(durations_dt.sum()), idle_duration_dt)
+
+    def test_int_half_up_ties(self):
+        """Test that the integer variant rounds ties half-up."""
+        scales = np.asarray([1, 1], dtype=np.int64)
+        durations_dt = partition_durations_int(scales, 5, 2)
+        self.assertEqual(list(durations_dt), [3, 2])
+
+    def test_int_matches_float_variant(self):
+        """Test both variants agree away from rounding ties.
+
+        The cumulative scales (1, 3, 7, 8 over a total of 8) and the
+        idle durations are chosen so that no cumulative target falls
+        on a .5 tie, where the two variants legitimately differ
+        (round() ties to even, the integer variant rounds half-up).
+        """
+        scales = np.asarray([1, 2, 4, 1], dtype=np.int64)
+        fractions = scales / 8
+        for idle_duration_dt in (0, 1, 7, 13, 800):
+            self.assertEqual(
+                list(partition_durations_int(scales, idle_duration_dt, 8)),
+                list(partition_durations(fractions, idle_duration_dt)))
+
+
+class TestUddScales(unittest.TestCase):
+    """Test the Uhrig inter-pulse scale computation."""
+
+    def test_sums_to_one(self):
+        """Test that the scales of every order sum to one."""
+        for repetition_number in (1, 2, 3, 5, 8, 32):
+            self.assertAlmostEqual(
+                float(udd_scales(repetition_number).sum()), 1.0)
+
+    def test_matches_sin_squared_differences(self):
+        """Test against the differences of the sin^2 Uhrig offsets."""
+        for repetition_number in (2, 3, 5, 8, 32):
+            offsets = np.sin(
+                np.pi * np.arange(repetition_number + 1) /
+                (2 * repetition_number)) ** 2
+            np.testing.assert_allclose(udd_scales(repetition_number),
+                                       np.diff(offsets), atol=1e-15)
+
+
+if __name__ == "__main__":
+    unittest.main()